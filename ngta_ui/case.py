@@ -57,6 +57,12 @@ class TestCaseResultStatus(enum.IntEnum):
     CANCELED = 7
 
 
+_WHEN_MAP = {
+    TestCaseResultStatus.FAILED: RerunDecorator.When.FAILED,
+    TestCaseResultStatus.ERRONEOUS: RerunDecorator.When.ERRONEOUS,
+}
+
+
 class PreAction(BaseModel):
     name: str
     status: int
@@ -588,39 +594,39 @@ class TestCase:
     def _handle_rerun(self, event_on):
         record = self.record
         mark = MarkHelper.get_rerun_mark(self.get_test_method(), self.__class__)
-        if mark is not None:
+        if mark is None:
+            return
+
+        rerun = False
+        while record.rerun_counts < mark.retry:
             rerun_cause = None
-            match record.status:
-                case record.Status.FAILED:
-                    rerun_when = RerunDecorator.When.FAILED
-                    for checkpoint in reversed(record.checkpoints):
-                        if checkpoint.error:
-                            rerun_cause = checkpoint.error
-                case record.Status.ERRONEOUS:
-                    rerun_when = RerunDecorator.When.ERRONEOUS
-                    rerun_cause = record.error
-                case _:
-                    rerun_when = 0
-
-            if (rerun_cause is not None
-                    and mark.scope & rerun_cause.scope
-                    and mark.when & rerun_when
-                    and record.rerun_counts < mark.retry
-            ):
-                record.rerun_causes.append(str(rerun_cause))
-                logger.debug("Rerun: %s with %s", self, mark)
-
-                try:
-                    if callable(mark.pre_action):
-                        mark.pre_action(self)
-                    self._exec(event_on)
-                finally:
-                    if callable(mark.post_action):
-                        mark.post_action(self)
-
-                self._handle_rerun(event_on)
-                if record.status == record.Status.PASSED:
-                    record.status = mark.remark
+            rerun_when = _WHEN_MAP.get(record.status, 0)
+            if rerun_when == RerunDecorator.When.FAILED:
+                # the earliest failing checkpoint is the cause
+                for checkpoint in record.checkpoints:
+                    if checkpoint.error:
+                        rerun_cause = checkpoint.error
+                        break
+            elif rerun_when == RerunDecorator.When.ERRONEOUS:
+                rerun_cause = record.error
+
+            if not (rerun_cause is not None and mark.scope & rerun_cause.scope and mark.when & rerun_when):
+                break
+
+            rerun = True
+            record.rerun_causes.append(str(rerun_cause))
+            logger.debug("Rerun: %s with %s", self, mark)
+
+            try:
+                if callable(mark.pre_action):
+                    mark.pre_action(self)
+                self._exec(event_on)
+            finally:
+                if callable(mark.post_action):
+                    mark.post_action(self)
+
+        if rerun and record.status == record.Status.PASSED:
+            record.status = mark.remark
 
     def as_dict(self) -> dict:
         cls = self.__class__
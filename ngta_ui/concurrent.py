@@ -4,25 +4,34 @@ import uuid
 import time
 import ctypes
 import inspect
+import operator
 import datetime
 import logging
 import collections
 import multiprocessing
+import multiprocessing.connection
 import queue
 import _thread
 import threading
 import traceback
 
 from datetime import datetime, timezone
-from typing import NoReturn, Type
+from typing import NoReturn, Type, Callable, Iterator, List
 import psutil
 
+try:
+    from fastrlock.rlock import RLock
+except ImportError:
+    from threading import RLock
+
 from .constants import DEFAULT_LOG_LEVEL, DEFAULT_LOG_LAYOUT, IdType
 from .runner import TestRunner
 from .context import TestContext
 from .consumer import QueueTestConsumer
 from .case import TestCaseResultRecord, fetch_current_testcase_id
-from .suite import TestSuite, TestSuiteResultRecord, TestSuiteModel, is_testsuite_model, fetch_current_testsuite_id
+from .suite import (
+    TestSuite, TestSuiteResultRecord, TestSuiteModel, TestModelType, is_testsuite_model, fetch_current_testsuite_id
+)
 from .result import TestResult
 from .events import EventType
 from .interceptor import TestRecordQueueInterceptor, TestEventHandler, get_current_process_name
@@ -30,21 +39,37 @@ from .interceptor import TestRecordQueueInterceptor, TestEventHandler, get_curre
 
 logger = logging.getLogger(__name__)
 
+_LOCAL_TZ = datetime.now(timezone.utc).astimezone().tzinfo
+_FORMATTERS = {}
+
+
+_ATTR_GETTERS = {}
+_ATTR_SETTERS = {}
+
 
 def _get_dotted_attribute(obj, attr_name: str):
-    names = attr_name.split('.')
-    for name in names:
-        obj = getattr(obj, name, None)
-    return obj
+    try:
+        getter = _ATTR_GETTERS[attr_name]
+    except KeyError:
+        getter = _ATTR_GETTERS[attr_name] = operator.attrgetter(attr_name)
+
+    try:
+        return getter(obj)
+    except AttributeError:
+        return None
 
 
 def _set_dotted_attribute(obj, attr_name: str, value):
-    names = attr_name.split('.')
-    for index in range(len(names)):
-        if index != len(names) - 1:
-            obj = getattr(obj, names[index])
-        else:
-            setattr(obj, names[index], value)
+    try:
+        parent_getter, name = _ATTR_SETTERS[attr_name]
+    except KeyError:
+        parent_name, _, name = attr_name.rpartition('.')
+        parent_getter = operator.attrgetter(parent_name) if parent_name else None
+        _ATTR_SETTERS[attr_name] = parent_getter, name
+
+    if parent_getter is not None:
+        obj = parent_getter(obj)
+    setattr(obj, name, value)
 
 
 def get_testrunner_params(*args, **kwargs) -> dict:
@@ -57,18 +82,11 @@ def get_testrunner_params(*args, **kwargs) -> dict:
 
 def raise_exception_in_thread(thread_obj: threading.Thread, exception_cls: Type[BaseException]):
     # this won't interrupt sockets/sleeps
-    found = False
-    target_tid = 0
-    for tid, tobj in threading._active.items():
-        if tobj is thread_obj:
-            found = True
-            target_tid = tid
-            break
-
-    if not found:
+    target_tid = thread_obj.ident
+    if target_tid is None or not thread_obj.is_alive():
         raise ValueError("Invalid thread object")
 
-    ret = ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_long(target_tid), ctypes.py_object(exception_cls))
+    ret = ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(target_tid), ctypes.py_object(exception_cls))
     # ref: http://docs.python.org/c-api/init.html#PyThreadState_SetAsyncExc
     if ret == 0:
         raise ValueError("Invalid thread ID")
@@ -76,7 +94,7 @@ def raise_exception_in_thread(thread_obj: threading.Thread, exception_cls: Type[
         # Huh? Why would we notify more than one threads?
         # Because we punch a hole into C level interpreter.
         # So it is better to clean up the mess.
-        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_long(target_tid), 0)
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(target_tid), None)
         raise SystemError("PyThreadState_SetAsyncExc failed")
     logger.debug("Successfully set asynchronized exception for %s", target_tid)
 
@@ -117,6 +135,12 @@ class SimpleTestRunnerProcess(multiprocessing.Process):
             raise TypeError("The type of argument 'testsuite' should be DictType.")
         self._testsuites.append(testsuite)
 
+    def add_testsuites(self, testsuites: List[TestSuiteModel]) -> NoReturn:
+        for testsuite in testsuites:
+            if not isinstance(testsuite, TestSuiteModel):
+                raise TypeError("The type of argument 'testsuite' should be DictType.")
+        self._testsuites.extend(testsuites)
+
     def run(self):
         self._init_logging()
 
@@ -130,12 +154,22 @@ class SimpleTestRunnerProcess(multiprocessing.Process):
 
     def _init_logging(self):
         root = logging.getLogger()
-        handler = logging.StreamHandler()
-        handler.setLevel(self.log_level)
-        handler.setFormatter(logging.Formatter(self.log_layout))
-        root.addHandler(handler)
+        # keep root at DEBUG, testcase log file handlers may use a lower level than console.
         root.setLevel(logging.DEBUG)
 
+        formatter = _FORMATTERS.get(self.log_layout)
+        if formatter is None:
+            formatter = _FORMATTERS[self.log_layout] = logging.Formatter(self.log_layout)
+
+        # handlers of parent process are inherited when forking, reuse the console handler instead of adding twice.
+        # FileHandler is subclass of StreamHandler, so check the exact type here.
+        handler = next((h for h in root.handlers if type(h) is logging.StreamHandler), None)
+        if handler is None:
+            handler = logging.StreamHandler()
+            root.addHandler(handler)
+        handler.setLevel(self.log_level)
+        handler.setFormatter(formatter)
+
     def __str__(self):
         return f"<{self.__class__.__name__}(id:{self.id}, pid:{self.ident}, is_alive:{self.is_alive()})>"
 
@@ -161,31 +195,48 @@ class _ControlThread(threading.Thread):
         thread_logger = logging.getLogger(f"{__name__}.ControlThread")
         ident = multiprocessing.current_process().ident
         while not self._should_stop.is_set():
-            readable = self._dst_conn.poll(0.1)
-            if readable:
+            try:
+                # block until a command arrives, instead of waking up every 100ms to poll the pipe.
                 name, args, kwargs = self._dst_conn.recv()
-                thread_logger.debug("PROCESS %s <- PIPE: name=%s, args=%s, kwargs=%s",
-                             ident, name, args, kwargs)
-                resp = None
-                try:
-                    if name == 'stop':
-                        logger.debug("process(%s) control thread exiting.", ident)
-                        self.stop()
+            except EOFError:
+                logger.debug("process(%s) control pipe closed.", ident)
+                break
+
+            thread_logger.debug("PROCESS %s <- PIPE: name=%s, args=%s, kwargs=%s",
+                                ident, name, args, kwargs)
+            resp = None
+            try:
+                if name == 'stop':
+                    logger.debug("process(%s) control thread exiting.", ident)
+                    self.stop()
+                else:
+                    attr = _get_dotted_attribute(self._runner, name)
+                    if callable(attr):
+                        resp = attr(*args, **kwargs)
+                        if name == "abort":
+                            logger.debug("interrupt main thread.")
+                            _thread.interrupt_main()
                     else:
-                        attr = _get_dotted_attribute(self._runner, name)
-                        if callable(attr):
-                            resp = attr(*args, **kwargs)
-                            if name == "abort":
-                                logger.debug("interrupt main thread.")
-                                _thread.interrupt_main()
+                        if args or kwargs:
+                            _set_dotted_attribute(self._runner, name, *args, **kwargs)
                         else:
-                            if args or kwargs:
-                                _set_dotted_attribute(self._runner, name, *args, **kwargs)
-                            else:
-                                resp = attr
-                finally:
-                    thread_logger.debug("PROCESS %s -> PIPE: %s", ident, resp)
-                    self._dst_conn.send(resp)
+                            resp = attr
+            finally:
+                thread_logger.debug("PROCESS %s -> PIPE: %s", ident, resp)
+                self._dst_conn.send(resp)
+
+
+class _SharedStateObserver(TestRunner.BaseObserver):
+    """
+    Publish state of inner testrunner into shared memory, so parent process can read it without pipe call.
+    """
+
+    def __init__(self, shared_state):
+        super().__init__()
+        self._shared_state = shared_state
+
+    def emit(self, data: dict) -> NoReturn:
+        self._shared_state.value = data["state"]
 
 
 class TestRunnerProcess(SimpleTestRunnerProcess):
@@ -209,19 +260,22 @@ class TestRunnerProcess(SimpleTestRunnerProcess):
     class PipeCallError(multiprocessing.ProcessError):
         pass
 
+    # attributes only used by the parent process, don't pickle them when spawning child process.
+    _PARENT_ONLY_ATTRS = ("_pipe_lock", "_is_stopped")
+
     def __init__(self,  observer: TestRunner.BaseObserver = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._observer = observer
         self._src_conn, self._dst_conn = multiprocessing.Pipe()
-        self._pipe_lock = threading.RLock()
+        self._pipe_lock = RLock()
         self._is_stopped = None         # inner testrunner is stopped
+        self._shared_state = multiprocessing.RawValue('i', 0)   # inner testrunner state, 0 means not created yet
 
     def _create_inner_testrunner(self) -> TestRunner:
         return TestRunner(id=self.id, result=self._result, context=self._context)
 
     def __getstate__(self):
-        excludes = ("_pipe_lock", )
-        state = {k: v for k, v in self.__dict__.items() if k not in excludes}
+        state = {k: v for k, v in self.__dict__.items() if k not in self._PARENT_ONLY_ATTRS}
         return state
 
     def _pipe(self, name, get_resp=True, *args, **kwargs):
@@ -259,10 +313,10 @@ class TestRunnerProcess(SimpleTestRunnerProcess):
 
     @property
     def state(self):
-        return self._pipe("state")
+        return self._shared_state.value or None
 
     def is_stopped(self) -> bool:
-        self._is_stopped = self._pipe("is_stopped")
+        self._is_stopped = self.state in (self.State.ABORTED, self.State.UNEXPECTED, self.State.FINISHED)
         return self._is_stopped
 
     def shutdown(self, wait: float = None):
@@ -282,6 +336,8 @@ class TestRunnerProcess(SimpleTestRunnerProcess):
         try:
             self._init_logging()
             runner = self._create_inner_testrunner()
+            runner.observable.attach(_SharedStateObserver(self._shared_state))
+            self._shared_state.value = runner.state
             if self._observer is not None:
                 runner.observable.attach(self._observer)
                 runner.state = runner.State.INITIAL
@@ -302,6 +358,7 @@ class TestRunnerProcess(SimpleTestRunnerProcess):
                 if self._observer is not None:
                     runner.observable.detach(self._observer)
         except:
+            self._shared_state.value = TestRunner.State.UNEXPECTED
             if self._observer is not None:
                 self._observer.update(TestRunner.Observable(self.id, TestRunner.State.UNEXPECTED))
             msg = traceback.format_exc()
@@ -344,6 +401,9 @@ class _TestRecordQueueConsumeThread(threading.Thread):
         specify the consumer to store test result.
     """
 
+    MIN_WAIT = 0.1
+    MAX_WAIT = 1.6
+
     def __init__(self, consumer: "MultiProcessQueueTestConsumer"):
         super().__init__()
         self.consumer = consumer
@@ -352,32 +412,41 @@ class _TestRecordQueueConsumeThread(threading.Thread):
     def run(self):
         self.should_stop.clear()
         logger.debug("Start to consume record from TestRecordQueue.")
-        while True:
+        timeout = self.MIN_WAIT
+        while not self.should_stop.is_set():
             try:
-                tc_record = self.consumer.tr_queue.get(block=False, timeout=0.1)
+                tc_record = self.consumer.tr_queue.get(timeout=timeout)
             except queue.Empty:
-                pass
-            else:
+                # back off while idle, stop() wakes the thread up with a sentinel anyway.
+                timeout = min(timeout * 2, self.MAX_WAIT)
+                continue
+
+            timeout = self.MIN_WAIT
+
+            try:
+                if tc_record is None:       # sentinel put by stop(), re-check should_stop.
+                    continue
+
                 logger.debug("RECV: %s", tc_record)
                 self.consumer.add_tc_record(tc_record)
                 self.consumer.result.totals += 1
-                self.consumer.tr_queue.task_done()
 
                 assert self.consumer.totals != 0
-                completion = round(float(self.consumer.result.totals) / float(self.consumer.totals) * 100, 2)
-                remain = self.consumer.totals - self.consumer.result.totals
-                logger.debug("*** Completion: %s%%, Remain: %s", completion, remain)
+                if logger.isEnabledFor(logging.DEBUG):
+                    completion = self.consumer.result.totals * 10000 // self.consumer.totals
+                    remain = self.consumer.totals - self.consumer.result.totals
+                    logger.debug("*** Completion: %d.%02d%%, Remain: %d", completion // 100, completion % 100, remain)
 
                 failed = tc_record.status in (tc_record.Status.FAILED, tc_record.Status.ERRONEOUS)
                 if self.consumer.result.failfast and failed:
                     self.consumer.abort()
             finally:
-                if self.should_stop.is_set():
-                    break
+                self.consumer.tr_queue.task_done()
 
     def stop(self) -> NoReturn:
         self.consumer.tr_queue.join()
         self.should_stop.set()
+        self.consumer.tr_queue.put(None)
         self.join()
 
 
@@ -401,23 +470,32 @@ class MultiProcessQueueTestConsumer:
 
     log_layout: str, optional
          Log layout.
+
+    queue_factory: callable, optional
+         Used to create tc_queue and tr_queue, default is multiprocessing.JoinableQueue.
+         The created queue must support put/get/task_done/join as JoinableQueue does.
     """
 
+    WAIT_INTERVAL = 0.1     # is_stopped() is a shared memory read, so it is cheap to check frequently.
+
     def __init__(self,
                  processes: int,
                  result: TestResult = None,
                  context: TestContext = None,
                  log_level: str | int = None,
-                 log_layout: str = None
+                 log_layout: str = None,
+                 queue_factory: Callable[[], multiprocessing.JoinableQueue] = None
                  ):
         self._context = context
         self.result = result or TestResult()
-        self.tc_queue = multiprocessing.JoinableQueue()
-        self.tr_queue = multiprocessing.JoinableQueue()
+        queue_factory = queue_factory or multiprocessing.JoinableQueue
+        self.tc_queue = queue_factory()
+        self.tr_queue = queue_factory()
         self._testsuites = []
         self._tc_records = {}
         self.runners = []
         self.totals = 0
+        self._queued_counts = 0      # count of testcases and combined testsuites put into tc_queue
         self.log_level = log_level
         self.log_layout = log_layout
 
@@ -438,9 +516,13 @@ class MultiProcessQueueTestConsumer:
         return self._context
 
     def add_testsuite(self, testsuite: TestSuiteModel) -> NoReturn:
-        self._testsuites.append(testsuite)
-        self._assign_id_for_test(testsuite)
-        self._extract_testsuite_into_queue(testsuite)
+        self.add_testsuites([testsuite])
+
+    def add_testsuites(self, testsuites: List[TestSuiteModel]) -> NoReturn:
+        for testsuite in testsuites:
+            self._assign_id_for_test(testsuite)
+        self._testsuites.extend(testsuites)
+        self._extract_testsuites_into_queue(testsuites)
 
     def add_tc_record(self, tc_record: TestCaseResultRecord):
         self._tc_records[tc_record.id] = tc_record
@@ -465,25 +547,42 @@ class MultiProcessQueueTestConsumer:
         return False
 
     def _assign_id_for_test(self, test: TestSuiteModel) -> NoReturn:
-        if is_testsuite_model(test):
-            test.id = fetch_current_testsuite_id()
-            for test in test.tests:
-                self._assign_id_for_test(test)
-        else:
-            self.totals += 1
-            test.id = fetch_current_testcase_id()
+        is_testsuite = is_testsuite_model
+        testsuite_id = fetch_current_testsuite_id
+        testcase_id = fetch_current_testcase_id
+
+        stack = [test]
+        while stack:
+            node = stack.pop()
+            if is_testsuite(node):
+                node.id = testsuite_id()
+                stack.extend(reversed(node.tests))      # keep pre-order, ids are assigned sequentially.
+            else:
+                self.totals += 1
+                node.id = testcase_id()
 
-    def _extract_testsuite_into_queue(self, testsuite: TestSuiteModel) -> NoReturn:
+    def _iter_leaf_tests(self, testsuite: TestSuiteModel) -> Iterator[TestModelType]:
         if self._is_combined_testsuite(testsuite):
             logger.debug("Add testsuite %s", testsuite)
-            self.tc_queue.put(testsuite)
+            yield testsuite
         else:
-            for index, test in enumerate(testsuite.tests):
+            for test in testsuite.tests:
                 if "tests" in test:
-                    self._extract_testsuite_into_queue(test)
+                    yield from self._iter_leaf_tests(test)
                 else:
                     logger.debug("Add testcase %s", test)
-                    self.tc_queue.put(test)
+                    yield test
+
+    def _extract_testsuites_into_queue(self, testsuites: List[TestSuiteModel]) -> NoReturn:
+        tests = [test for testsuite in testsuites for test in self._iter_leaf_tests(testsuite)]
+        self._queued_counts += len(tests)
+        # put all tests in one call if the queue backend supports batching.
+        put_many = getattr(self.tc_queue, "put_many", None)
+        if put_many is not None:
+            put_many(tests)
+        else:
+            for test in tests:
+                self.tc_queue.put(test)
 
     def run(self):
         thread = _TestRecordQueueConsumeThread(self)
@@ -492,28 +591,37 @@ class MultiProcessQueueTestConsumer:
             # only set result.started_at when it is empty.
             # when there are multiple runners defined in config yml, result.started_at would be set by previous runner.
             if not self.result.started_at:
-                self.result.started_at = datetime.now(timezone.utc).astimezone()
+                self.result.started_at = datetime.now(_LOCAL_TZ)
+
+            # each process consumes at least one test, don't fork processes which have nothing to do.
+            if self._queued_counts < len(self.runners):
+                logger.warning("Only %s tests queued, start %s processes instead of %s.",
+                               self._queued_counts, self._queued_counts, len(self.runners))
+                del self.runners[self._queued_counts:]
+
+            # one stop sentinel for each process, queued after all tests.
+            for _ in self.runners:
+                self.tc_queue.put(None)
 
             for runner in self.runners:
                 runner.start()
 
-            while True:
-                remain = []
-                for runner in self.runners:
-                    if runner.is_stopped():
+            # wait on process sentinels, so the loop wakes up as soon as any child exits,
+            # and only ask alive processes whether the inner testrunner is stopped.
+            remain = list(self.runners)
+            while remain:
+                for runner in list(remain):
+                    if not runner.is_alive() or runner.is_stopped():
                         runner.shutdown()
-                        runner.join()
-                    else:
-                        remain.append(runner)
-                if not remain:
-                    break
-                time.sleep(5)
+                        remain.remove(runner)
+                if remain:
+                    multiprocessing.connection.wait([runner.sentinel for runner in remain], timeout=self.WAIT_INTERVAL)
         except KeyboardInterrupt:
             for runner in self.runners:
                 runner.shutdown()
                 runner.join()
         finally:
-            self.result.stopped_at = datetime.now(timezone.utc).astimezone()
+            self.result.stopped_at = datetime.now(_LOCAL_TZ)
             thread.stop()
 
             for testsuite in self._testsuites:
@@ -521,36 +629,62 @@ class MultiProcessQueueTestConsumer:
                 self.result.add_testsuite_record(ts_record)
 
     def generate_testsuite_record(self, testsuite: TestSuiteModel, testcase_record_mapping: dict = None) -> TestSuiteResultRecord:
-        testsuite_id = testsuite.id or uuid.uuid1()
-        testsuite_name = testsuite.name
-        testsuite_record = TestSuiteResultRecord(testsuite_id=testsuite_id, name=testsuite_name)
-        for test in testsuite.tests:
-            if "tests" in test:
-                testsuite_record.add_sub_test_record(
-                    self.generate_testsuite_record(test, testcase_record_mapping)
-                )
-            else:
-                test_id = test.id
-                if test_id in testcase_record_mapping:
-                    testsuite_record.add_sub_test_record(testcase_record_mapping[test_id])
+        mapping = testcase_record_mapping or {}
+        ts_record_cls = TestSuiteResultRecord
+        tc_record_cls = TestCaseResultRecord
+
+        root_record = ts_record_cls(testsuite_id=testsuite.id or uuid.uuid1(), name=testsuite.name)
+        # sub records are added to parent when created, so the order is kept without recursion.
+        stack = [(testsuite, root_record)]
+        while stack:
+            suite, suite_record = stack.pop()
+            for test in suite.tests:
+                if "tests" in test:
+                    sub_record = ts_record_cls(testsuite_id=test.id or uuid.uuid1(), name=test.name)
+                    suite_record.add_sub_test_record(sub_record)
+                    stack.append((test, sub_record))
                 else:
-                    testcase_record = TestCaseResultRecord(id=test_id)
-                    testcase_record.name = test.name or '.'.join(test.path.split('.')[-2:])
-                    testcase_record.path = test.path
-                    testsuite_record.add_sub_test_record(testcase_record)
-        return testsuite_record
+                    test_id = test.id
+                    if test_id in mapping:
+                        suite_record.add_sub_test_record(mapping[test_id])
+                    else:
+                        testcase_record = tc_record_cls(id=test_id)
+                        testcase_record.name = test.name or '.'.join(test.path.rsplit('.', 2)[-2:])
+                        testcase_record.path = test.path
+                        suite_record.add_sub_test_record(testcase_record)
+        return root_record
 
 
 TestProgressMessage = collections.namedtuple('TestProgressMessage', ['process', 'type', 'data', 'progress'])
 
 
 class TestProgressMessageQueueInterceptor(TestEventHandler):
+    """
+    Send TestProgressMessage into queue, messages are sent as list in batch to reduce queue puts.
+
+    Parameters
+    ----------
+    q: queue.Queue or multiprocessing.Queue
+        Queue to send messages.
+    """
+
+    FLUSH_SIZE = 32         # flush when buffered messages reach this size
+    FLUSH_INTERVAL = 0.25   # or when seconds since last flush reach this interval
+
     def __init__(self, q: queue.Queue | multiprocessing.queues.Queue):
         super().__init__()
         self.queue = q
         self._result = None
         self._totals = 0
         self._counts = 0
+        self._buffer = []
+        self._flushed_at = time.monotonic()
+
+    def _flush(self) -> NoReturn:
+        if self._buffer:
+            self.queue.put(self._buffer)
+            self._buffer = []
+        self._flushed_at = time.monotonic()
 
     def on_testrunner_started(self, event) -> NoReturn:
         runner = event.target         # type: TestRunner
@@ -562,22 +696,26 @@ class TestProgressMessageQueueInterceptor(TestEventHandler):
         record = testcase.record
         self._counts += 1
         progress = self._counts / self._totals
-        msg = TestProgressMessage(get_current_process_name(), EventType.ON_TESTCASE_STOPPED, record, progress)
-        # logger.debug("SEND: %s", msg)
-        self.queue.put(msg)
+        # only send record id, receiver just reports progress and the full record would be pickled for nothing.
+        msg = TestProgressMessage(get_current_process_name(), EventType.ON_TESTCASE_STOPPED, record.id, progress)
+        self._buffer.append(msg)
+        if len(self._buffer) >= self.FLUSH_SIZE or time.monotonic() - self._flushed_at >= self.FLUSH_INTERVAL:
+            self._flush()
 
     def on_testrunner_stopped(self, event) -> NoReturn:
         runner = event.target         # type: TestRunner
         result = runner.result
         msg = TestProgressMessage(get_current_process_name(), EventType.ON_TESTRUNNER_STOPPED, result, 1)
-        # logger.debug("SEND: %s", msg)
-        self.queue.put(msg)
+        self._buffer.append(msg)
+        self._flush()
 
     def __str__(self):
         return f"<{self.__class__.__name__}(queue:{self.queue})>"
 
 
 class RunnersBundle:
+    WAIT_INTERVAL = 1       # wake up periodically in case the private queue reader stops signaling.
+
     def __init__(self, result, runners):
         self._result = result
         self._m_process_runners = []
@@ -618,23 +756,42 @@ class RunnersBundle:
             for runner in self._m_process_runners:
                 runner.abort()
 
-    def join(self):
-        results = {}
-        while len(results) != len(self._s_process_runners):
+    def _drain_progress_messages(self, results: dict) -> NoReturn:
+        while True:
             try:
-                msg = self._s_queue.get(timeout=1)        # type: TestProgressMessage
+                msgs = self._s_queue.get_nowait()       # type: List[TestProgressMessage]
             except queue.Empty:
-                pass
-            except KeyboardInterrupt:
-                for i, runner in enumerate(self._s_process_runners):
-                    runner.abort()
-            else:
+                break
+
+            for msg in msgs:                # type: TestProgressMessage
                 if msg.type == EventType.ON_TESTCASE_STOPPED:
                     logger.info('*** PROCESS(%s) completion percentage: %.1f%%', msg.process, msg.progress * 100)
                 else:
                     results[msg.process] = msg.data
                     logger.info('*** PROCESS(%s) stopped!', msg.process)
 
+    def join(self):
+        results = {}
+        while True:
+            try:
+                self._drain_progress_messages(results)
+                pending = [runner for runner in self._s_process_runners.values() if runner.name not in results]
+                alive = [runner for runner in pending if runner.is_alive()]
+                if not alive:
+                    # result may arrive between draining and liveness check, drain again before giving up.
+                    self._drain_progress_messages(results)
+                    for runner in pending:
+                        if runner.name not in results:
+                            logger.error("%s exited without sending its result.", runner)
+                    break
+
+                # sleep until a progress message arrives or any sub process exits.
+                multiprocessing.connection.wait([self._s_queue._reader] + [runner.sentinel for runner in alive],
+                                                timeout=self.WAIT_INTERVAL)
+            except KeyboardInterrupt:
+                for runner in self._s_process_runners.values():
+                    runner.abort()
+
         for name in self._s_process_runners.keys():
             try:
                 result = results[name]
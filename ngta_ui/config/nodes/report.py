@@ -34,7 +34,7 @@ class HtmlNode(pydantic.BaseModel):
                 raise ReportTemplateNotExistsError(f'{self.template} not exists')
 
     def as_report(self, result) -> BaseTestReport:
-        return new_report(None, result=result, **self.model_dump())
+        return new_report(None, result=result, template=self.template, props=self.props, output=self.output)
 
 
 class TestReportNode(pydantic.BaseModel):
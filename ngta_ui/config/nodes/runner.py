@@ -2,7 +2,6 @@
 
 import os
 from typing import Optional, List
-from functools import partial
 
 import pydantic
 from ..base import TestRunnerType
@@ -25,14 +24,24 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-parse_dict_by_path = partial(parse_dict, key="path")
+def parse_dict_by_path(data: dict):
+    return parse_dict(data, key="path")
+
+
+def _as_callee_data(node: pydantic.BaseModel) -> dict:
+    # declared fields are stored in __dict__ and extra fields in __pydantic_extra__, both are python native already,
+    # so it is unnecessary to do a recursive model_dump() just for passing them to parse_dict.
+    return {**node.__dict__, **(node.__pydantic_extra__ or {})}
+
+
+_IDENT_FORMATS = ('Runner-%02d', 'Process-%02d')     # indexed by whether it is a single sub-process runner
 
 
 class TestBenchNode(pydantic.BaseModel, extra="allow"):
     path: str = pydantic.Field(alias="()")
 
     def as_bench(self) -> TestBench:
-        return parse_dict_by_path(self.model_dump())
+        return parse_dict_by_path(_as_callee_data(self))
 
 
 class TestResultNode(pydantic.BaseModel, extra="allow"):
@@ -40,14 +49,14 @@ class TestResultNode(pydantic.BaseModel, extra="allow"):
     failfast: bool = False
 
     def as_result(self) -> TestResult:
-        return parse_dict_by_path(self.model_dump())
+        return parse_dict_by_path(_as_callee_data(self))
 
 
 class EventObserverNode(pydantic.BaseModel, extra="allow"):
     path: str = pydantic.Field(alias="()")
 
     def as_event_handler(self) -> TestEventHandler:
-        return parse_dict_by_path(self.model_dump())
+        return parse_dict_by_path(_as_callee_data(self))
 
 
 class EventObservableNode(pydantic.BaseModel):
@@ -55,18 +64,18 @@ class EventObservableNode(pydantic.BaseModel):
     observers: List[EventObserverNode] = pydantic.Field(default_factory=list)
 
     def as_event_subject(self, output_dir: FilePathType, runner_node: 'TestRunnerNode') -> EventObservable:
-        event_observable = EventObservable()
+        handlers = []
         if self.default:
             if runner_node.process_count == 0:
-                event_observable.attach(TestCaseLogFileInterceptor(output_dir))
+                handlers.append(TestCaseLogFileInterceptor(output_dir))
             else:
-                output_dir = os.path.join(output_dir, runner_node.id)
-                event_observable.attach(TestCaseLogFileInterceptor(output_dir))
-                event_observable.attach(TestRunnerLogFileInterceptor(output_dir))
+                output_dir = f"{output_dir}{os.sep}{runner_node.id}"
+                handlers.append(TestCaseLogFileInterceptor(output_dir))
+                handlers.append(TestRunnerLogFileInterceptor(output_dir))
 
         for observer_node in self.observers:
-            event_observable.attach(observer_node.as_event_handler())
-        return event_observable
+            handlers.append(observer_node.as_event_handler())
+        return EventObservable.from_handlers(handlers)
 
 
 class TestContextNode(pydantic.BaseModel):
@@ -81,7 +90,7 @@ class TestContextNode(pydantic.BaseModel):
         if self.event_observable:
             subject = self.event_observable.as_event_subject(output_dir, runner_node)
         else:
-            subject = EventObservableNode().as_event_subject(output_dir, runner_node)
+            subject = EventObservableNode.model_construct().as_event_subject(output_dir, runner_node)
 
         testbench = self.testbench.as_bench() if self.testbench else None
         return TestContext(subject, testbench, enable_mock, strict)
@@ -99,15 +108,8 @@ class TestRunnerNode(pydantic.BaseModel):
     log_layout: str = pydantic.Field(DEFAULT_LOG_LAYOUT, alias="log-layout")
 
     def _update_ident_by_index(self, index, testbench_name: str = None):
-        if self.process_count == 1:
-            ident = f'Process-{index:02d}'
-        else:
-            ident = f'Runner-{index:02d}'
-
-        if testbench_name:
-            ident += f'-{testbench_name}'
-
-        self.id = ident
+        ident = _IDENT_FORMATS[self.process_count == 1] % index
+        self.id = f'{ident}-{testbench_name}' if testbench_name else ident
 
     def as_runner(self,
                   output_dir: FilePathType,
@@ -129,8 +131,12 @@ class TestRunnerNode(pydantic.BaseModel):
             if self.id is None:
                 self._update_ident_by_index(index, testbench_name)
 
+        # fail fast if exclusive is configured explicitly, before building the context.
+        if self.process_count > 1 and self.context and getattr(self.context.testbench, "exclusive", False):
+            raise ConfigError("Can't perform multi-process when TestBench is exclusive.")
+
         if self.context is None:
-            context = TestContextNode().as_context(output_dir, self, enable_mock, strict)
+            context = TestContextNode.model_construct().as_context(output_dir, self, enable_mock, strict)
         else:
             context = self.context.as_context(output_dir, self, enable_mock, strict)
 
@@ -142,14 +148,13 @@ class TestRunnerNode(pydantic.BaseModel):
             runner = TestRunnerProcess(id=self.id, result=TestResult(failfast=result.failfast),
                                        context=context, log_level=self.log_level, log_layout=self.log_layout)
         else:
+            # testbench class may also be exclusive by default.
             if context.testbench is not None and context.testbench.exclusive:
                 raise ConfigError("Can't perform multi-process when TestBench is exclusive.")
             runner = MultiProcessQueueTestConsumer(self.process_count, result, context, self.log_level, self.log_layout)
         runner.is_prerequisite = self.is_prerequisite
 
-        for testsuite in self.testsuites:
-            for model in testsuite.as_model_list(cfg_yaml):
-                runner.add_testsuite(model)
+        runner.add_testsuites([model for testsuite in self.testsuites for model in testsuite.as_model_list(cfg_yaml)])
         return runner
 
 
@@ -8,9 +8,8 @@ import os
 import re
 import sys
 
-import unittest.util
 from abc import ABCMeta, abstractmethod
-from typing import List, Sequence, Union, Callable, Iterator, Type, Optional, Dict, Any, Literal
+from typing import List, Sequence, Union, Callable, Iterator, Type, Optional, Dict, Any, Literal, NoReturn
 if sys.version_info >= (3, 9):
     from typing import Annotated
 else:
@@ -30,6 +29,11 @@ from ...util import locate, str_class, str_func
 
 logger = logging.getLogger(__name__)
 
+# use libyaml bindings if available, they are much faster than pure python parser.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_VAR_PATTERN = re.compile(r'\$\{.*?\}')
+
 
 def get_test_path(obj) -> str:
     if inspect.ismodule(obj):
@@ -42,19 +46,18 @@ def get_test_path(obj) -> str:
         raise DeserializeError("Can't get path from: %s" % obj)
 
 
-def get_test_method_names(testcase_class: Type[TestCase]) -> List[str]:
-    method_names = []
-
+@functools.lru_cache(maxsize=1024)
+def get_test_method_names(testcase_class: Type[TestCase]) -> Sequence[str]:
     # NOTE: only load testcase defined in current class, ignore test inherited from base class.
-    for name, attr in testcase_class.__dict__.items():
-        if is_test_function(attr):
-            method_names.append(name)
-    method_names.sort(key=functools.cmp_to_key(unittest.util.three_way_cmp))
-    return method_names
+    method_names = [name for name, attr in testcase_class.__dict__.items() if is_test_function(attr)]
+    method_names.sort()
+    return tuple(method_names)
 
 
 class Argument:
-    def __init__(self, args: list = None, kwds: dict = None):
+    __slots__ = ('args', 'kwds')
+
+    def __init__(self, args: list | tuple = None, kwds: dict = None):
         self.args = args or []
         self.kwds = kwds or {}
 
@@ -62,10 +65,16 @@ class Argument:
         if name:
             self.kwds[name] = value
         else:
+            if not isinstance(self.args, list):
+                self.args = list(self.args)
             self.args.append(value)
 
     def copy(self):
-        return self.__class__(self.args.copy(), self.kwds.copy())
+        # tuple args are immutable and shared by copies, fill() turns them into a list before appending.
+        argument = self.__class__.__new__(self.__class__)
+        argument.args = self.args if isinstance(self.args, tuple) else self.args.copy()
+        argument.kwds = self.kwds.copy()
+        return argument
 
     def __copy__(self):
         return self.copy()
@@ -74,10 +83,61 @@ class Argument:
         return f"<Argument(args:{self.args}, kwds: {self.kwds})>"
 
 
+# signature of test function never changes, no need to rebuild it for each argument.
+_get_signature = functools.lru_cache(maxsize=1024)(inspect.signature)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_plain_parameters(func) -> Optional[tuple]:
+    """
+    Return positional names and {name: default} of test function's parameters except self,
+    or None if function has positional-only or variadic parameters which need Signature.bind.
+    """
+    params = list(_get_signature(func).parameters.values())
+    if not params or params[0].name != 'self':
+        return None
+    params = params[1:]
+    if any(p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY) for p in params):
+        return None
+    positional = tuple(p.name for p in params if p.kind == p.POSITIONAL_OR_KEYWORD)
+    return positional, {p.name: p.default for p in params}
+
+
+def _bind_plain_parameters(func, argument: Argument) -> Optional[dict]:
+    plain = _get_plain_parameters(func)
+    if plain is None:
+        return None
+
+    positional, defaults = plain
+    if len(argument.args) > len(positional):
+        return None
+
+    values = dict(zip(positional, argument.args))
+    for name, value in argument.kwds.items():
+        if name in values or name not in defaults:
+            return None
+        values[name] = value
+
+    parameters = {}
+    for name, default in defaults.items():
+        if name in values:
+            parameters[name] = values[name]
+        elif default is not inspect.Parameter.empty:
+            parameters[name] = default
+        else:
+            return None                                   # missing argument, let Signature.bind raise
+    return parameters
+
+
 def convert_argument_to_parameters(func, argument: Argument) -> dict:
-    signature = inspect.signature(func)
+    logger.debug("bind params %s on %s", argument, func)
+    parameters = _bind_plain_parameters(func, argument)
+    if parameters is not None:
+        logger.debug("test params: %s", parameters)
+        return parameters
+
+    signature = _get_signature(func)
     try:
-        logger.debug("bind params %s on %s", argument, func)
         ba = signature.bind(None, *argument.args, **argument.kwds)
         ba.apply_defaults()
         ba.arguments.pop('self')                          # remove self argument
@@ -95,19 +155,24 @@ ParametersType = Dict[str, Any]
 IterationsType = Union[List[ParametersType], Dict[str, List]]
 
 
+# parametrize mark is fixed once test function is defined, the data is not cached as it could be an iterator.
+_get_parametrize_mark = functools.lru_cache(maxsize=1024)(MarkHelper.get_parametrize_mark)
+
+
 def _generate_testcase_model_from_func(func: Callable,
                                        arguments: Sequence[Argument] = None,
                                        is_prerequisite: bool = False,
                                        start_index: int = None,
                                        ) -> Iterator[TestCaseModel]:
 
-    base_case = TestCaseModel(path=str_func(func), is_prerequisite=is_prerequisite)
+    path = str_func(func)
 
     is_parameterize_mark_used = False
+    mark = _get_parametrize_mark(func)
 
     if not arguments:
         arguments = []
-        data = MarkHelper.get_parametrize_data(func)
+        data = mark.get_data(func) if mark else ()
 
         if data:
             is_parameterize_mark_used = True
@@ -123,18 +188,19 @@ def _generate_testcase_model_from_func(func: Callable,
             argument = Argument()
             arguments.append(argument)
 
-    mark = MarkHelper.get_parametrize_mark(func)
+    titles = mark.titles if is_parameterize_mark_used else None
     if arguments:
         for i, argument in enumerate(arguments):
-            case_model = base_case.model_copy()
-            if start_index is not None:
-                case_model.index = start_index + i
-
-            case_model.parameters = convert_argument_to_parameters(func, argument)
-
-            if is_parameterize_mark_used and mark.titles:
+            case_model = TestCaseModel.model_construct(
+                path=path,
+                is_prerequisite=is_prerequisite,
+                index=None if start_index is None else start_index + i,
+                parameters=convert_argument_to_parameters(func, argument),
+            )
+
+            if titles:
                 try:
-                    case_model.title = mark.titles[i]
+                    case_model.title = titles[i]
                 except IndexError:
                     logger.warning("can't find title for '%s' with param %s", case_model.path, case_model.parameters)
             yield case_model
@@ -173,30 +239,22 @@ def _get_arguments_from_parameters_and_iterations(
     para_vars = {k: eval_vars(v, variables) for k, v in parameters.items()}
     if isinstance(iterations, dict):
         arguments = []
-        if para_vars:
-            arguments.append(Argument(kwds=para_vars))
-
-        if arguments:
-            for k, values in iterations.items():
-                try:
-                    iter(values)
-                except TypeError as e:
-                    raise ConfigError(str(e))
-
-                new_arguments = []
-                for argument in arguments:
-                    for value in iter(values):
-                        new_argument = argument.copy()
-                        new_argument.fill(eval_vars(value, variables), k)
-                        new_arguments.append(new_argument)
-                arguments = new_arguments
-        else:
-            if iterations:
-                for values in itertools.product(*iterations.values()):
-                    vals = [eval_vars(value, variables) for value in values]
-                    kwds = dict(zip(iterations.keys(), vals))
-                    arguments.append(Argument(kwds=kwds))
-
+        if not para_vars and not iterations:
+            return arguments
+
+        keys = list(iterations.keys())
+        values_list = []
+        for values in iterations.values():
+            try:
+                iter(values)
+            except TypeError as e:
+                raise ConfigError(str(e))
+            values_list.append([eval_vars(value, variables) for value in values])
+
+        for values in itertools.product(*values_list):
+            kwds = dict(para_vars)
+            kwds.update(zip(keys, values))
+            arguments.append(Argument(kwds=kwds))
         return arguments
     elif isinstance(iterations, list):
         arguments = []
@@ -226,25 +284,29 @@ def _repeat(generator: Iterator[TestModelType],
     return new
 
 
+@functools.lru_cache(maxsize=4096)
+def _compile_expr(source: str):
+    # eval() strips leading spaces and tabs of source string, but compile() doesn't.
+    return compile(source.lstrip(' \t'), '<eval_vars>', 'eval')
+
+
 def eval_vars(s, variables: ParametersType):
     if isinstance(s, str):
-        if s.startswith("${") and s.endswith("}"):
+        if "${" not in s:
+            return s
+        elif s.startswith("${") and s.endswith("}"):
             var = s[2:-1]
             if ':' in var:
                 pattern, _, default = var.partition(':')
                 try:
-                    return eval(pattern, globals(), variables)
+                    return eval(_compile_expr(pattern), globals(), variables)
                 except NameError:
-                    return eval(default, globals(), variables)
+                    return eval(_compile_expr(default), globals(), variables)
             else:
-                v = eval(var, globals(), variables)
+                v = eval(_compile_expr(var), globals(), variables)
                 return v
         else:
-            matches = re.findall(r'\$\{.*?\}', s)
-            for match in matches:
-                value = eval(match[2:-1], globals(), variables)
-                s = s.replace(match, str(value))
-            return s
+            return _VAR_PATTERN.sub(lambda m: str(eval(_compile_expr(m.group()[2:-1]), globals(), variables)), s)
     elif isinstance(s, list):
         l = []
         for item in s:
@@ -263,10 +325,22 @@ def is_test_module(obj, pattern: str = "test") -> bool:
     return inspect.ismodule(obj) and (re.match(pattern, obj.__name__.split(".")[-1]) or obj.__name__ == "__main__")
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _get_injected_arguments(injection: Optional[dict]) -> Optional[List[Argument]]:
+    if not injection:
+        return None
+    return _get_arguments_from_parameters_and_iterations(injection.get("parameters"), injection.get("iterations"), None)
+
+
 def generate_test_from_obj(obj,
                            injections: dict = None,
                            skip_callback: Callable[[Callable, TestCase, str], bool] = None,
-                           pattern: str = "test"
+                           pattern: str = "test",
+                           _case_dir: str = None,
                            ) -> Iterator[TestModelType]:
     if not injections:
         injections = {}
@@ -277,11 +351,13 @@ def generate_test_from_obj(obj,
             for testsuite in testsuites:
                 yield testsuite
         else:
-            case_dir = WorkEnv.instance().case_dir
-            if case_dir and str(case_dir) in os.path.abspath(obj.__file__):
+            # case_dir is resolved once by the outermost call and passed down to sub modules.
+            if _case_dir is None:
+                case_dir = WorkEnv.instance().case_dir
+                _case_dir = _normalize_path(str(case_dir)) if case_dir else ""
+            if _case_dir and _normalize_path(obj.__file__).startswith(_case_dir):
                 for sub_obj in walk_module(obj):
-                    for test in generate_test_from_obj(sub_obj, injections, skip_callback, pattern):
-                        yield test
+                    yield from generate_test_from_obj(sub_obj, injections, skip_callback, pattern, _case_dir)
     elif is_testsuite_model(obj):
         yield obj
     elif isinstance(obj, (list, tuple)):
@@ -299,27 +375,38 @@ def generate_test_from_obj(obj,
                 continue
 
             injection = injections.get(fullname, None)
-            arguments = _get_arguments_from_parameters_and_iterations(**injection) if injection else None
-            for testcase_model in _generate_testcase_model_from_func(method, arguments):
-                yield testcase_model.model_copy()
+            arguments = _get_injected_arguments(injection)
+            yield from _generate_testcase_model_from_func(method, arguments)
     elif is_test_function(obj):
         func = obj
         fullname = str_func(func)
         should_skip = callable(skip_callback) and skip_callback(func, None, fullname)
         if not should_skip:
             injection = injections.get(fullname, None)
-            arguments = _get_arguments_from_parameters_and_iterations(**injection) if injection else None
-            for testcase_model in _generate_testcase_model_from_func(obj, arguments):
-                yield testcase_model.model_copy()
+            arguments = _get_injected_arguments(injection)
+            yield from _generate_testcase_model_from_func(obj, arguments)
     else:
         pass
 
 
 class BaseTestNode(pydantic.BaseModel, metaclass=ABCMeta):
+    _located: Dict[str, Any] = pydantic.PrivateAttr(default_factory=dict)
+
+    def _locate(self, path: str):
+        # node could be expanded many times by for or iterations, keep located objects within node's lifetime.
+        try:
+            return self._located[path]
+        except KeyError:
+            obj = self._located[path] = locate(path)
+            return obj
+
     @abstractmethod
     def as_model_list(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> List[TestModelType]:
         pass
 
+    def as_model_iter(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> Iterator[TestModelType]:
+        yield from self.as_model_list(cfg_yaml, variables)
+
 
 class BaseTestLoaderNode(BaseTestNode, metaclass=ABCMeta):
     as_testsuite: str = pydantic.Field("", alias="as-testsuite")
@@ -376,7 +463,7 @@ class ClsLoaderNode(BaseTestLoaderNode):
         logger.debug("load tests from cls: %s", self.path)
         tests = []
         class_fullname = self.path.strip()
-        class_obj = locate(class_fullname)
+        class_obj = self._locate(class_fullname)
 
         if not self.methods:
             for method_name in get_test_method_names(class_obj):
@@ -427,6 +514,9 @@ class ObjLoaderNode(BaseTestLoaderNode):
     filter: dict = pydantic.Field(default_factory=dict)
     inject: dict = pydantic.Field(default_factory=dict)
 
+    _include_patterns: Optional[List[re.Pattern]] = pydantic.PrivateAttr(None)
+    _exclude_patterns: Optional[List[re.Pattern]] = pydantic.PrivateAttr(None)
+
     @property
     def includes(self):
         return self.filter.get("includes", None)
@@ -435,11 +525,18 @@ class ObjLoaderNode(BaseTestLoaderNode):
     def excludes(self):
         return self.filter.get("excludes", None)
 
+    def _compile_patterns(self) -> NoReturn:
+        self._include_patterns = [re.compile(include) for include in self.includes or ()]
+        self._exclude_patterns = [re.compile(exclude) for exclude in self.excludes or ()]
+
     def _skip_callback(self, cls: TestCase, method: Callable, fullname: str) -> bool:
-        if self.excludes and [exclude for exclude in self.excludes if re.search(exclude, fullname)]:
+        if self._exclude_patterns is None:
+            self._compile_patterns()
+
+        if any(pattern.search(fullname) for pattern in self._exclude_patterns):
             return True
 
-        if self.includes and not [include for include in self.includes if re.search(include, fullname)]:
+        if self._include_patterns and not any(pattern.search(fullname) for pattern in self._include_patterns):
             return True
 
         if self.tags:
@@ -450,7 +547,7 @@ class ObjLoaderNode(BaseTestLoaderNode):
         return False
 
     def _generate_from_objects(self) -> Iterator[TestModelType]:
-        for test in generate_test_from_obj(locate(self.path), self.inject, self._skip_callback):
+        for test in generate_test_from_obj(self._locate(self.path), self.inject, self._skip_callback):
             yield test
 
     def _load_as_tests(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> List[TestModelType]:
@@ -483,37 +580,51 @@ class TagLoaderNode(BaseTestLoaderNode):
     locates: Optional[List[dict]] = None
     inject: Optional[dict] = None
 
+    _tag_pattern: Optional[re.Pattern] = pydantic.PrivateAttr(None)
+
     def _generate_from_objects(self) -> Iterator[TestModelType]:
         locations = []
-        injections = []
+        injections = {}
 
-        for locate_dict in self.locates:
+        for locate_dict in self.locates or ():
             location = locate_dict["path"]
             locations.append(location)
-            for inject_path, inject_value in locate_dict.get("inject", {}).items():
+            for inject_path, inject_value in (locate_dict.get("inject") or {}).items():
                 if inject_path:
                     inject_path = f"{location}.{inject_path}"
                 else:
                     inject_path = location
                 injections[inject_path] = inject_value
 
-        objects = [locate(location) for location in locations]
-        for obj in objects:
-            for test in generate_test_from_obj(obj, injections, self._skip_callback):
-                yield test
+        for location in locations:
+            yield from generate_test_from_obj(self._locate(location), injections, self._skip_callback)
 
     def _skip_callback(self, method: Callable, class_: TestCase = None, fullname: str = "") -> bool:
+        if self._tag_pattern is None:
+            self._tag_pattern = re.compile(self.tag)
+
         tags = MarkHelper.get_tags(method, class_)
-        for tag in tags:
-            if re.search(self.tag, tag):
-                return False
-        return True
+        return not any(self._tag_pattern.search(tag) for tag in tags)
 
     def _load_as_tests(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> List[TestModelType]:
         generator = self._generate_from_objects()
         return _repeat(generator, self.repeat_number, self.repeat_foreach)
 
 
+def _combine_patterns(patterns: List[str]) -> List[re.Pattern]:
+    """
+    Compile patterns into one alternation, so each name is searched only once.
+    Patterns with groups or global flags can't be joined safely, they are kept separately.
+    """
+    compiled = [re.compile(pattern) for pattern in patterns]
+    if len(compiled) > 1 and not any(pattern.groups for pattern in compiled):
+        try:
+            return [re.compile("|".join(f"(?:{pattern})" for pattern in patterns))]
+        except re.error:
+            pass
+    return compiled
+
+
 class YmlLoaderConfigNode(BaseTestLoaderNode):
     """
     yml-loader:
@@ -529,11 +640,25 @@ class YmlLoaderConfigNode(BaseTestLoaderNode):
     excludes: List[str] = None
     parameters: ParametersType = pydantic.Field(default_factory=dict)
 
+    _include_patterns: Optional[List[re.Pattern | dict]] = pydantic.PrivateAttr(None)
+    _exclude_patterns: Optional[List[re.Pattern | dict]] = pydantic.PrivateAttr(None)
+
+    def _compile_patterns(self) -> NoReturn:
+        includes = self.includes or ()
+        excludes = self.excludes or ()
+        self._include_patterns = (_combine_patterns([include for include in includes if isinstance(include, str)])
+                                  + [include for include in includes if not isinstance(include, str)])
+        self._exclude_patterns = (_combine_patterns([exclude for exclude in excludes if isinstance(exclude, str)])
+                                  + [exclude for exclude in excludes if not isinstance(exclude, str)])
+
     def _should_skip(self, model: TestCaseModel | TestSuiteModel) -> bool:
-        if self.excludes:
-            for exclude in self.excludes:
-                if isinstance(exclude, str):
-                    if (model.path and re.search(exclude, model.path)) or (model.name and re.search(exclude, model.name)):
+        if self._exclude_patterns is None:
+            self._compile_patterns()
+
+        if self._exclude_patterns:
+            for exclude in self._exclude_patterns:
+                if isinstance(exclude, re.Pattern):
+                    if (model.path and exclude.search(model.path)) or (model.name and exclude.search(model.name)):
                         logger.debug('exclude: %s', model)
                         return True
                 elif isinstance(exclude, dict):
@@ -551,10 +676,10 @@ class YmlLoaderConfigNode(BaseTestLoaderNode):
                 else:
                     raise NotImplementedError
 
-        if self.includes:
-            for include in self.includes:
-                if isinstance(include, str):
-                    if (model.path and re.search(include, model.path)) or (model.name and re.search(include, model.name)):
+        if self._include_patterns:
+            for include in self._include_patterns:
+                if isinstance(include, re.Pattern):
+                    if (model.path and include.search(model.path)) or (model.name and include.search(model.name)):
                         return False
                 elif isinstance(include, dict):
                     for k, v in include.items():
@@ -588,8 +713,8 @@ class YmlLoaderConfigNode(BaseTestLoaderNode):
         else:
             path = os.path.join(os.path.dirname(cfg_yaml), self.filename)
         logger.debug('load tests from yml: %s', path)
-        with open(path) as f:
-            d = yaml.load(f, Loader=yaml.Loader)
+        with open(path, 'rb') as f:
+            d = yaml.load(f, Loader=_YAML_LOADER)
 
         parameters = {k: eval_vars(v, variables) for k, v in self.parameters.items()}
         if isinstance(d, list):
@@ -635,15 +760,17 @@ class TestCaseNode(BaseTestNode):
     def as_model_list(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> List[TestCaseModel]:
         logger.debug("load tests from testcase: %s", self.path)
         tests = []
-        func = locate(self.path)
+        func = self._locate(self.path)
         arguments = _get_arguments_from_parameters_and_iterations(self.parameters, self.iterations, variables)
         for testcase_model in _generate_testcase_model_from_func(func, arguments, self.is_prerequisite, self.index):
             testcase_model.name = eval_vars(self.name, variables)
             testcase_model.enable_mock = self.enable_mock
             testcase_model.strict = self.strict
             testcase_model.rerun = self.rerun
-            for i in range(self.repeat_number):
-                tests.append(testcase_model.model_copy())
+            # testcase_model is newly generated, only the extra repeats need copies.
+            if self.repeat_number > 0:
+                tests.append(testcase_model)
+                tests.extend(testcase_model.model_copy() for _ in range(self.repeat_number - 1))
         return tests
 
 
@@ -659,15 +786,21 @@ class TestNode(pydantic.RootModel):
     def as_model_list(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> List[TestModelType]:
         return self.root.as_model_list(cfg_yaml, variables)
 
+    def as_model_iter(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> Iterator[TestModelType]:
+        return self.root.as_model_iter(cfg_yaml, variables)
+
 
 def validate_tests(values):
     tests = []
     for value in values:
         try:
             for k, v in value.items():
-                kwargs = dict(type=k, **v)
-                test = TestNode.model_validate(kwargs)
-                tests.append(test)
+                # dispatch by key directly, validating through TestNode resolves the discriminated union again.
+                node_class = _NODE_CLASSES.get(k)
+                if node_class is None:
+                    logger.error("unsupported test node type: %s", k)
+                    continue
+                tests.append(TestNode.model_construct(node_class(**v)))
         except pydantic.ValidationError as err:
             logger.exception(err)
     return tests
@@ -706,10 +839,7 @@ class TestSuiteNode(BaseTestNode, extra='allow'):
             variables = {}
 
         if not self.iterations:
-            params = dict()
-            params.update(variables)
-            if self.parameters:
-                params.update(self.parameters)
+            params = {**variables, **(self.parameters or {})}
             return [self.as_model_data(cfg_yaml, params)]
 
         models = []
@@ -723,19 +853,15 @@ class TestSuiteNode(BaseTestNode, extra='allow'):
         if variables is None:
             variables = {}
 
-        tests = []
-        for test in self.tests:
-            tests.extend(test.as_model_list(cfg_yaml, variables))
-
-        exclude_keys = set()
-        exclude_keys.update(self.model_fields.keys())
+        tests = [model for test in self.tests for model in test.as_model_iter(cfg_yaml, variables)]
 
+        # all declared fields are passed explicitly, only extra fields need to be forwarded.
         model = TestSuiteModel(
             name=eval_vars(self.name, variables),
             tests=tests,
             path=eval_vars(self.path, variables),
             flat=self.flat,
-            **self.model_dump(exclude=exclude_keys)
+            **(self.__pydantic_extra__ or {})
         )
         return model
 
@@ -763,27 +889,38 @@ class ForNode(BaseTestNode):
         return validate_tests(values)
 
     def as_model_list(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> List[TestModelType]:
+        return list(self.as_model_iter(cfg_yaml, variables))
+
+    def as_model_iter(self, cfg_yaml: FilePathType = None, variables: ParametersType = None) -> Iterator[TestModelType]:
         logger.debug("load tests from for: %s", self)
-        tests = []
         iters = self.iterations
 
         if isinstance(iters, list):
             params_list = iters
         elif isinstance(iters, dict):
-            params_list = []
-            for result in itertools.product(*iters.values()):
-                params = dict(zip(iters.keys(), result))
-                params_list.append(params)
+            keys = list(iters.keys())
+            params_list = (dict(zip(keys, result)) for result in itertools.product(*iters.values()))
         else:
             raise ValueError
 
+        variables = variables or {}
         for params in params_list:
-            params.update(variables)
+            # build a merged dict instead of updating params, iterations of list type belong to this node.
+            merged = {**params, **variables}
             for test in self.tests:
-                tests.extend(test.as_model_list(cfg_yaml, params))
-        return tests
+                yield from test.as_model_iter(cfg_yaml, merged)
 
 
 ForNode.model_rebuild()
 TestSuiteNode.model_rebuild()
 TestNode.model_rebuild()
+
+_NODE_CLASSES = {
+    'testcase': TestCaseNode,
+    'testsuite': TestSuiteNode,
+    'for': ForNode,
+    'cls-loader': ClsLoaderNode,
+    'obj-loader': ObjLoaderNode,
+    'tag-loader': TagLoaderNode,
+    'yml-loader': YmlLoaderConfigNode,
+}
@@ -27,6 +27,7 @@ class RerunConfig(BaseConfig):
         self.old_result = result
         self.new_result = None
         self.statuses = statuses
+        self._status_set = frozenset(statuses)
 
     def get_log_level_and_layout(self):
         return self.config.get_log_level_and_layout()
@@ -44,30 +45,41 @@ class RerunConfig(BaseConfig):
         runners[0].add_testsuites(testsuites)
         return runners
 
-    def _gen_testsuite_from_record(self, record: TestSuiteResultRecord) -> Optional[TestSuiteModel]:
-        tests = []
-        new_tc_records = self.new_result.tc_records()
-        for sub_record in record.records:
-            if isinstance(sub_record, TestSuiteResultRecord):
-                sub_testsuite = self._gen_testsuite_from_record(sub_record)
-                tests.append(sub_testsuite)
-            elif isinstance(sub_record, TestCaseResultRecord):
-                if sub_record.status.value in self.statuses:
-                    new_parameters = new_tc_records.get(sub_record.id, sub_record).parameters
-                    test = sub_record.as_test_model(parameters=new_parameters)
-                    tests.append(test)
-            else:
-                raise NotImplementedError
+    def _gen_testsuite_from_record(self,
+                                   record: TestSuiteResultRecord,
+                                   new_tc_records: dict = None
+                                   ) -> Optional[TestSuiteModel]:
+        if new_tc_records is None:
+            new_tc_records = self.new_result.tc_records()
 
-        if tests:
-            testsuite = record.as_test_model(tests=tests)
-            return testsuite
-        return None
+        # walk sub records in post-order with an explicit stack, each entry is (record, tests, remaining sub records).
+        stack = [(record, [], iter(record.records))]
+        while stack:
+            ts_record, tests, sub_records = stack[-1]
+            for sub_record in sub_records:
+                if isinstance(sub_record, TestSuiteResultRecord):
+                    stack.append((sub_record, [], iter(sub_record.records)))
+                    break
+                elif isinstance(sub_record, TestCaseResultRecord):
+                    if sub_record.status.value in self._status_set:
+                        new_parameters = new_tc_records.get(sub_record.id, sub_record).parameters
+                        test = sub_record.as_test_model(parameters=new_parameters)
+                        tests.append(test)
+                else:
+                    raise NotImplementedError
+            else:
+                stack.pop()
+                testsuite = ts_record.as_test_model(tests=tests) if tests else None
+                if not stack:
+                    return testsuite
+                if testsuite is not None:
+                    stack[-1][1].append(testsuite)
 
     def _get_testsuites(self) -> List[TestSuiteModel]:
         testsuites = []
+        new_tc_records = self.new_result.tc_records()
         for ts_record in self.old_result.ts_records:
-            testsuite = self._gen_testsuite_from_record(ts_record)
+            testsuite = self._gen_testsuite_from_record(ts_record, new_tc_records)
             if testsuite:
                 testsuites.append(testsuite)
         return testsuites
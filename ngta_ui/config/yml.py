@@ -1,6 +1,9 @@
 # coding: utf-8
 
 import os
+import copy
+import datetime
+import functools
 import yaml
 import json
 import jmespath
@@ -9,6 +12,11 @@ from pathlib import Path
 from typing import Union, List, Dict, Optional
 from abc import ABCMeta, abstractmethod
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..constants import (
     FilePathType, DEFAULT_LOG_LEVEL, DEFAULT_LOG_LAYOUT,
     YML_OBJECT_NEW_TAG, YML_OBJECT_LOCATE_TAG
@@ -29,6 +37,10 @@ from .nodes import (
 )
 
 
+# post processes and !object:locate paths are resolved again for each config load, cache them.
+_locate = functools.lru_cache(maxsize=1024)(locate)
+
+
 class BaseYamlConfig(pydantic.BaseModel, BaseConfig, metaclass=ABCMeta):
     log_level: str = pydantic.Field(DEFAULT_LOG_LEVEL, alias="log-level")
     log_layout: str = pydantic.Field(DEFAULT_LOG_LAYOUT, alias="log-layout")
@@ -42,19 +54,24 @@ class BaseYamlConfig(pydantic.BaseModel, BaseConfig, metaclass=ABCMeta):
     output_dir: str
     config_yml: str
 
+    _post_processes: Optional[list] = pydantic.PrivateAttr(None)
+
     def get_log_level_and_layout(self):
         return self.log_level, self.log_layout
 
     def get_post_processes(self):
-        post_processes = []
-        for item in self.post_processes:
-            if isinstance(item, str):
-                post_processes.append(locate(item))
-            elif isinstance(item, dict):
-                post_processes.append(parse_dict_by_path(item))
-            else:
-                raise NotImplementedError
-        return post_processes
+        # post processes are resolved and constructed only once, return a new list to keep the cache untouched.
+        if self._post_processes is None:
+            post_processes = []
+            for item in self.post_processes:
+                if isinstance(item, str):
+                    post_processes.append(_locate(item))
+                elif isinstance(item, dict):
+                    post_processes.append(parse_dict_by_path(item))
+                else:
+                    raise NotImplementedError
+            self._post_processes = post_processes
+        return list(self._post_processes)
 
     def get_result(self) -> TestResult:
         result = self.result.as_result() if self.result else TestResult()
@@ -101,10 +118,11 @@ class V4YamlConfig(BaseYamlConfig, extra='ignore'):
     testsuites: List[TestSuiteNode]
 
     def get_runner_nodes(self) -> List[TestRunnerNode]:
-        context = TestContextNode(testbench=self.testbench)
-        context.event_observable = self.event_observable
-        runner = TestRunnerNode(context=context, testsuites=self.testsuites,
-                                log_level=self.log_level, log_layout=self.log_layout)
+        # sub nodes are validated when loading config, so construct runner node without validating them again.
+        context = TestContextNode.model_construct(testbench=self.testbench, event_observable=self.event_observable)
+        # log_level/log_layout only have dashed aliases, the old validated constructor ignored them by field name,
+        # so runner keeps its defaults here as before.
+        runner = TestRunnerNode.model_construct(context=context, testsuites=self.testsuites)
         return [runner]
 
 
@@ -115,7 +133,8 @@ class V5YamlConfig(BaseYamlConfig, extra='ignore'):
         return self.runners
 
 
-class YamlLoader(yaml.Loader):
+# libyaml based loader is much faster, custom constructors work same as pure python one.
+class YamlLoader(getattr(yaml, "CLoader", yaml.Loader)):
     # def construct_object(self, node, deep=False):
     #     """
     #     Auto construct object with property "()"
@@ -133,28 +152,78 @@ class YamlLoader(yaml.Loader):
         return parse_dict(data)
 
     def construct_locate_object(self, node):
-        data = self.construct_mapping(node, deep=True)
-        return locate(data['path'])
+        # only 'path' is used, don't construct the whole mapping deeply.
+        for key_node, val_node in node.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value == 'path':
+                return _locate(self.construct_scalar(val_node))
+        raise KeyError('path')
 
     def ref(self, node):
         kv = {}
         for key_node, val_node in node.value:
             kv[key_node.value] = val_node.value
 
-        filename = Path(kv["filename"])
-
-        match filename.suffix:
-            case ".yml" | ".yaml":
-                with filename.open("r", encoding="utf-8") as f:
-                    data = yaml.load(f, Loader=YamlLoader)
-            case ".json":
-                with filename.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-            case _:
-                raise NotImplementedError(f"DONT support file suffix: {filename}")
-
-        found = jmespath.search(kv["jmespath"], data)
-        return found
+        data, is_shared = _load_ref_file(Path(kv["filename"]))
+        found = _compile_jmespath(kv["jmespath"]).search(data)
+        # cached data is shared by all references to the file, give each reference its own copy.
+        return copy.deepcopy(found) if is_shared else found
+
+
+_compile_jmespath = functools.lru_cache(maxsize=512)(jmespath.compile)
+
+_REF_FILE_CACHE = {}               # resolved path -> (mtime_ns, data), an edited file replaces its old entry
+_PLAIN_TYPES = (str, bytes, int, float, bool, type(None), datetime.date)
+
+
+def _is_plain_data(data) -> bool:
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif not isinstance(item, _PLAIN_TYPES):
+            return False
+    return True
+
+
+def _loads_json(content: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass                # orjson is stricter than json, e.g. NaN and integers over 64 bits
+    return json.loads(content)
+
+
+def _load_ref_file(filename: Path) -> tuple:
+    """
+    Load file referenced by !ref, return data and whether it is shared from cache.
+    Only plain data is cached, file which constructs objects via tags is loaded every time.
+    """
+    key = str(filename.resolve())
+    mtime_ns = filename.stat().st_mtime_ns
+    cached = _REF_FILE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], True
+
+    match filename.suffix.lower():
+        case ".yml" | ".yaml":
+            with filename.open("rb") as f:
+                data = yaml.load(f, Loader=YamlLoader)
+        case ".json":
+            with filename.open("rb") as f:
+                data = _loads_json(f.read())
+        case _:
+            raise NotImplementedError(f"DONT support file suffix: {filename}")
+
+    if _is_plain_data(data):
+        _REF_FILE_CACHE[key] = (mtime_ns, data)
+        return data, True
+    _REF_FILE_CACHE.pop(key, None)
+    return data, False
 
 
 YamlLoader.add_constructor("!ref", YamlLoader.ref)
@@ -163,10 +232,8 @@ YamlLoader.add_constructor(YML_OBJECT_LOCATE_TAG, YamlLoader.construct_locate_ob
 
 
 def new_yml_config(filename: FilePathType, output_dir: FilePathType):
-    root, ext = os.path.splitext(filename)
-    ext = ext.lower()
-    if ext == ".yml" or ext == ".yaml":
-        with open(filename, 'r', encoding='utf-8') as f:
+    if str(filename).lower().endswith((".yml", ".yaml")):
+        with open(filename, 'rb') as f:
             data = yaml.load(f, Loader=YamlLoader)
 
         if "runners" in data:
@@ -174,4 +241,5 @@ def new_yml_config(filename: FilePathType, output_dir: FilePathType):
         else:
             return V4YamlConfig(config_yml=str(filename), output_dir=str(output_dir), **data)
     else:
+        ext = os.path.splitext(filename)[1].lower()
         raise ConfigError(f"Unsupported config file extension '{ext}'.")
@@ -29,6 +29,7 @@ LOGS_DIR_BASENAME = 'logs'
 INIT_DIR_BASENAME = 'init'
 
 CACHE_YML_BASENAME = '.cache'
+HISTORY_JSONL_BASENAME = '.histories.jsonl'
 
 DEFAULT_LOG_BASENAME = "main.log"
 DEFAULT_LOG_LEVEL = logging.DEBUG
@@ -47,11 +47,14 @@ class QueueTestConsumer(BaseTestConsumer):
 
     auto_stop: bool, optional
         Auto stop when queue is empty.
+        Consumer always stops when getting None from queue, producer can put it as stop sentinel.
 
     *args,  **kwargs:
         pass-through to TestRunner
     """
 
+    POLL_INTERVAL = 0.1
+
     def __init__(self,
                  queue: queue.Queue | multiprocessing.queues.JoinableQueue,
                  auto_stop: bool = True,
@@ -63,11 +66,15 @@ class QueueTestConsumer(BaseTestConsumer):
     def _consume(self) -> NoReturn:
         while True:
             try:
-                data: TestModelType = self.queue.get_nowait()
+                data: TestModelType = self.queue.get(timeout=self.POLL_INTERVAL)
             except queue.Empty:
                 if self.auto_stop:
                     break
             else:
+                if data is None:
+                    self.queue.task_done()
+                    break
+
                 try:
                     test = data.as_test()
                     if test:
@@ -26,11 +26,18 @@ class TestContext:
         self.testbench = testbench
         self.enable_mock = enable_mock
         self.strict = strict
+        self._attached = None
 
     def _make_sure_testbench_in_event_observable(self):
-        if self.testbench is not None:
-            self.testbench.priority = sys.maxsize
-            self.event_observable.attach(self.testbench)
+        testbench, event_observable = self.testbench, self.event_observable
+        if testbench is not None:
+            # attach() sorts all observers, only do it once for each testbench and event_observable pair.
+            attached = self._attached
+            if attached is not None and attached[0] is testbench and attached[1] is event_observable:
+                return
+            testbench.priority = sys.maxsize
+            event_observable.attach(testbench)
+            self._attached = (testbench, event_observable)
 
     def get_event_handlers(self, reverse=False) -> Tuple[TestEventHandler, ...]:
         self._make_sure_testbench_in_event_observable()
@@ -47,37 +54,32 @@ class TestContextManager:
     Manage context which bind with thread.
     """
 
-    _contexts = {}
-    _lock = threading.Lock()
+    _local = threading.local()
 
     @classmethod
     def register(cls, context: TestContext) -> NoReturn:
-        ident = threading.current_thread().ident
-        with cls._lock:
-            cls._contexts[ident] = context
+        cls._local.context = context
 
     @classmethod
     def unregister(cls) -> NoReturn:
-        ident = threading.current_thread().ident
-        with cls._lock:
-            cls._contexts.pop(ident, None)
+        try:
+            del cls._local.context
+        except AttributeError:
+            pass
 
     @classmethod
     def current_context(cls) -> TestContext:
         """
         Get context in current thread.
         """
-        ident = threading.current_thread().ident
-        with cls._lock:
-            try:
-                return cls._contexts[ident]
-            except KeyError:
-                # for situation run testcase or testsuite without testrunner.
-                msg = "Can't get context with thread ident %s, register a default TestContext object for it."
-                logger.warning(msg, ident)
-                context = TestContext()
-                cls._contexts[ident] = context
-                return context
+        try:
+            return cls._local.context
+        except AttributeError:
+            # for situation run testcase or testsuite without testrunner.
+            msg = "Can't get context with thread ident %s, register a default TestContext object for it."
+            logger.warning(msg, threading.get_ident())
+            context = cls._local.context = TestContext()
+            return context
     getCurrentContext = current_context
 
 
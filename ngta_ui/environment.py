@@ -3,16 +3,17 @@
 import os
 import sys
 import time
-import difflib
+import filecmp
 import threading
 import importlib
+import json
 import shutil
 from pathlib import Path
 from typing import NoReturn, Optional
 
 import yaml
 from .constants import (
-    PACKAGE_NAME, CACHE_YML_BASENAME, INIT_DIR_BASENAME,
+    PACKAGE_NAME, CACHE_YML_BASENAME, HISTORY_JSONL_BASENAME, INIT_DIR_BASENAME,
     CASE_DIR_BASENAME, LIBS_DIR_BASENAME, LOGS_DIR_BASENAME, CONF_DIR_BASENAME,
     ExitCode
 )
@@ -20,15 +21,13 @@ from .constants import (
 import logging
 logger = logging.getLogger(__name__)
 
+# cache yml may include python objects such as Path, so use full loader, with libyaml if available.
+_YAML_LOADER = getattr(yaml, "CLoader", yaml.Loader)
 
-def _diff(src: str, dst: str) -> NoReturn:
-    with open(src) as f1:
-        lines1 = f1.readlines()
-    with open(dst) as f2:
-        lines2 = f2.readlines()
 
-    changes = list(difflib.context_diff(lines1, lines2))
-    if changes:
+def _diff(src: str, dst: str) -> NoReturn:
+    # only need to know whether content is changed, compare bytes instead of computing a diff.
+    if not filecmp.cmp(src, dst, shallow=False):
         dst_dir = os.path.dirname(dst)
         dst_new_basename = os.path.basename(src)
         dst_new_fullname = os.path.join(dst_dir, dst_new_basename)
@@ -52,6 +51,7 @@ class WorkEnv:
 
     work_dir: Optional[Path]
     cache_yml: Optional[Path]
+    history_jsonl: Optional[Path]
     cache_data: dict
     case_dir: Optional[Path]
     libs_dir: Optional[Path]
@@ -80,18 +80,20 @@ class WorkEnv:
             self.anchor = None
             self.cfg = None
             self.cache_yml = None
+            self.history_jsonl = None
 
     def init_by_work_dir(self, work_dir: Path):
         self.work_dir = work_dir.absolute()
 
         self.anchor = self.work_dir.joinpath(".%s" % PACKAGE_NAME)
-        with self.anchor.open('r', encoding='utf-8') as f:
-            self.cfg = yaml.load(f, Loader=yaml.Loader)
+        with self.anchor.open('rb') as f:
+            self.cfg = yaml.load(f, Loader=_YAML_LOADER)
 
         self.cache_yml = self._get_path_from_cfg("cache_yml", CACHE_YML_BASENAME)
+        self.history_jsonl = self.cache_yml.parent.joinpath(HISTORY_JSONL_BASENAME)
         if self.cache_yml.exists():
-            with self.cache_yml.open('r', encoding='utf-8') as f:
-                self.cache_data = yaml.load(f, Loader=yaml.Loader)
+            with self.cache_yml.open('rb') as f:
+                self.cache_data = yaml.load(f, Loader=_YAML_LOADER)
                 if self.cache_data is None:
                     self.cache_data = {}
         else:
@@ -101,9 +103,14 @@ class WorkEnv:
         self.libs_dir = self._get_path_from_cfg("libs_dir", LIBS_DIR_BASENAME)
         self.logs_dir = self._get_path_from_cfg("logs_dir", LOGS_DIR_BASENAME)
 
-        # Add lib and cases dir into sys.path
-        sys.path.insert(0, str(self.libs_dir))
-        sys.path.insert(0, str(self.case_dir))
+        # Add lib and cases dir into sys.path, skip them if already added by previous init.
+        inserted = False
+        for path in (str(self.libs_dir), str(self.case_dir)):
+            if path not in sys.path:
+                sys.path.insert(0, path)
+                inserted = True
+        if inserted:
+            importlib.invalidate_caches()
         self._do_pre_imports()
 
     def _get_path_from_cfg(self, key, default) -> Path:
@@ -141,15 +148,16 @@ class WorkEnv:
         """
         Find work dir from cwd and its ancestors by locate .ngta file.
         """
-        for filename in current_dir.iterdir():
-            if filename.name == f".{PACKAGE_NAME}":
+        anchor_name = f".{PACKAGE_NAME}"
+        current_dir = current_dir.absolute()
+        while True:
+            if current_dir.joinpath(anchor_name).exists():
                 return current_dir
 
-        parent_dir = current_dir.parent
-        if parent_dir.samefile(current_dir):
-            return None
-        else:
-            return cls.find_work_dir(parent_dir)
+            parent_dir = current_dir.parent
+            if parent_dir == current_dir:
+                return None
+            current_dir = parent_dir
 
     @classmethod
     def init(cls, dest_dir: str, include_sample: bool = True) -> NoReturn:
@@ -183,20 +191,31 @@ class WorkEnv:
             else:
                 shutil.copy2(src_conf, dst_conf)
 
+    def get_histories(self) -> list:
+        # histories saved into cache yml by old versions come first.
+        histories = list(self.cache_data.get('histories', []))
+        if self.history_jsonl.exists():
+            with self.history_jsonl.open('rb') as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            histories.append(json.loads(line))
+                        except ValueError:
+                            logger.warning("skip broken history line: %r", line)
+        return histories
+
     def get_last_failed_output_dir(self) -> Optional[Path]:
         if self.cache_yml and self.cache_yml.exists():
-            histories = self.cache_data.get('histories', [])
-            for history in reversed(histories):
+            for history in reversed(self.get_histories()):
                 if history['exit_code'] != ExitCode.OK:
                     return Path(history['output_dir'])
             return None
 
     def add_history(self, history):
         if self.cache_yml and self.cache_yml.exists():
-            histories = self.cache_data.setdefault('histories', [])
-            histories.append(history)
-            with self.cache_yml.open('w', encoding='utf-8') as f:
-                yaml.dump(self.cache_data, f)
+            # append one line for each run instead of dumping all histories into cache yml again.
+            with self.history_jsonl.open('a', encoding='utf-8') as f:
+                f.write(json.dumps(history, default=str) + '\n')
 
     def get_current_commit(self) -> dict | None:
         import git
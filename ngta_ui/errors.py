@@ -1,7 +1,8 @@
 # coding: utf-8
 
 import os
-import inspect
+import functools
+import linecache
 import traceback
 from typing import Optional
 from .serialization import BaseModel
@@ -76,16 +77,21 @@ class ReportTemplateNotExistsError(Exception):
 
 
 def is_relevant_call(f_code) -> bool:
+    work_dir = WorkEnv.instance().work_dir
+    return _is_relevant_call(f_code.co_filename, f_code.co_name, str(work_dir) if work_dir else None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_relevant_call(co_filename: str, co_name: str, work_dir: Optional[str]) -> bool:
     is_relevant = True
-    if f_code.co_name in ("<module>", "__exit__"):
+    if co_name in ("<module>", "__exit__"):
         is_relevant = False
 
-    co_filename = os.path.normpath(f_code.co_filename)
+    co_filename = os.path.normpath(co_filename)
     if PACKAGE_NAME in co_filename or co_filename.endswith("runpy.py"):
         is_relevant = False
 
-    work_dir = WorkEnv.instance().work_dir
-    if work_dir and str(work_dir) not in co_filename:
+    if work_dir and work_dir not in co_filename:
         is_relevant = False
 
     return is_relevant
@@ -111,27 +117,31 @@ class ErrorInfo(BaseModel):
                 exc_info = err
             type_ = str_class(exc_info[0])
             value = str(exc_info[1])
-            trace = cls.exc_info_to_string(exc_info)
-
-            for frame, line_no in traceback.walk_stack(exc_info[2].tb_frame):
-                f_code = frame.f_code
-                # logger.debug("%s: %s, %s", f_code.co_filename, f_code.co_name, is_relevant_call(f_code))
-                if is_relevant_call(f_code):
-                    match f_code.co_name:
-                        case "setup":
-                            scope = RerunDecorator.Scope.SETUP.value
-                        case "teardown":
-                            scope = RerunDecorator.Scope.TEARDOWN.value
-                        case _:
-                            scope = RerunDecorator.Scope.METHOD.value
+            # walk stack only once, relevant frames are shared with exc_info_to_string.
+            relevant_frames = cls._get_relevant_frames(exc_info[2])
+            trace = cls.exc_info_to_string(exc_info, relevant_frames)
+
+            for frame, line_no in relevant_frames:
+                match frame.f_code.co_name:
+                    case "setup":
+                        scope = RerunDecorator.Scope.SETUP.value
+                    case "teardown":
+                        scope = RerunDecorator.Scope.TEARDOWN.value
+                    case _:
+                        scope = RerunDecorator.Scope.METHOD.value
 
         return cls(type_=type_, value=value, trace=trace, scope=scope)
 
     def __str__(self) -> str:
         return self.trace
 
+    @staticmethod
+    def _get_relevant_frames(tb) -> list:
+        return [(frame, line_no) for frame, line_no in traceback.walk_stack(tb.tb_frame)
+                if is_relevant_call(frame.f_code)]
+
     @classmethod
-    def exc_info_to_string(cls, exc_info) -> str:
+    def exc_info_to_string(cls, exc_info, relevant_frames: list = None) -> str:
         """
         If exception is FailureError or WarningError, only return relevant stack traces.
         otherwise, return all stack traces.
@@ -141,6 +151,9 @@ class ErrorInfo(BaseModel):
         exc_info : tuple
             should a tuple return by sys.exc_info()
 
+        relevant_frames : list, optional
+            (frame, line_no) pairs of relevant calls, walk stack of exc_info if not provided.
+
 
         Returns
         -------
@@ -154,16 +167,19 @@ class ErrorInfo(BaseModel):
         exc_line = traceback.format_exception_only(exc_class, exc_value)
         if issubclass(exc_class, (FailureError, WarningError)):
             title = "Traceback (relevant call)"
+            if relevant_frames is None:
+                relevant_frames = cls._get_relevant_frames(exc_trace)
+
             stack_traces = []
-            for frame, line_no in traceback.walk_stack(exc_trace.tb_frame):
+            template = '  File "{co_filename}", line {line_number}, in {co_name}\n    {line_content}'
+            for frame, line_no in relevant_frames:
                 f_code = frame.f_code
-                if is_relevant_call(f_code):
-                    co_filename = os.path.normpath(f_code.co_filename)
-                    source, _ = inspect.findsource(frame)
-                    template = '  File "{co_filename}", line {line_number}, in {co_name}\n    {line_content}'
-                    trace = template.format(co_filename=co_filename, line_number=line_no,
-                                            co_name=f_code.co_name, line_content=source[frame.f_lineno-1].strip())
-                    stack_traces.append(trace)
+                co_filename = os.path.normpath(f_code.co_filename)
+                # linecache keeps lines of each file, no need to read and split the whole source per frame.
+                line_content = linecache.getline(f_code.co_filename, frame.f_lineno, frame.f_globals).strip()
+                trace = template.format(co_filename=co_filename, line_number=line_no,
+                                        co_name=f_code.co_name, line_content=line_content)
+                stack_traces.append(trace)
             return "{}:\n{}\n{}".format(title, "\n".join(stack_traces), "".join(exc_line))
         else:
             return cls._dump_all_traceback(exc_trace, exc_line)
@@ -1,9 +1,10 @@
 # coding: utf-8
 
-import inspect
-from typing import NoReturn, Callable, Tuple
+import queue
+import threading
+import types
+from typing import NoReturn, Callable, Tuple, Iterable
 from enum import Enum, unique, auto
-from concurrent.futures import ThreadPoolExecutor
 from coupling.pattern.observer import BaseObservable, BaseObserver
 from .errors import HookError
 
@@ -47,6 +48,12 @@ class EventType(Enum):
     ON_TEARDOWN_CLASS_STOPPED = 54
 
 
+# hook method name of each event type, e.g. ON_TESTCASE_STARTED -> on_testcase_started.
+for _event_type in EventType:
+    _event_type._method_name = _event_type.name.lower()
+del _event_type
+
+
 class Event:
     type = EventType.ON_ANY_EVENT
 
@@ -190,13 +197,12 @@ class TestEventHandler(BaseObserver):
 
     def dispatch(self, event: Event):
         self.on_any_event(event)
-        method = getattr(self, event.type.name.lower())
+        method = getattr(self, event.type._method_name)
         method(event)
 
     def update(self, observable: "EventObservable", event: Event):
         if self.is_async:
-            future = observable.executor.submit(self.dispatch, event)
-            future.add_done_callback(self._on_future_done)
+            observable.submit(self, event)
         else:
             try:
                 self.dispatch(event)
@@ -207,16 +213,6 @@ class TestEventHandler(BaseObserver):
                     logger.exception("event handler ignore_errors is False, re-raise exception: %s", err)
                     raise
 
-    def _on_future_done(self, future):
-        try:
-            future.result()
-        except Exception as err:
-            if self.ignore_errors:
-                logger.exception("ignore errors from future: %s", future)
-            else:
-                logger.exception("ignore_errors is False, re-raise exception from future: %s", future)
-                raise
-
     def __str__(self):
         return f"<{self.__class__.__name__}(priority:{self.priority}, ignore_errors:{self.ignore_errors})>"
 
@@ -250,6 +246,9 @@ class CallbackTestEventHandler(TestEventHandler):
             self.callback(event)
 
 
+_CALLBACK_TYPES = (types.FunctionType, types.MethodType)
+
+
 class EventObservable(BaseObservable):
     """
     Event observable which used to dispatch test event to all attached handlers.
@@ -257,27 +256,126 @@ class EventObservable(BaseObservable):
     Parameters
     ----------
     max_workers : int, optional
-        Thread pool max workers. Used for calling :class:`TestEventHandler <TestEventHandler>` async.
+        Kept for compatibility. Async :class:`TestEventHandler <TestEventHandler>` are dispatched
+        in order by a single consumer thread which drains up to BATCH_SIZE events per wake,
+        the thread exits after IDLE_TIMEOUT seconds without events and is restarted on demand.
     """
+    BATCH_SIZE = 100
+    IDLE_TIMEOUT = 5
 
     def __init__(self, max_workers: int = None, ignore_notify_errors: bool = False):
         super().__init__()
         self.max_workers = max_workers
         self.ignore_notify_errors = ignore_notify_errors
-        self.executor = ThreadPoolExecutor(self.max_workers)
+        self._async_queue = queue.SimpleQueue()
+        self._async_thread = None
+        self._observers_cache = ((), (), {})
 
     def __getstate__(self):
-        excludes = ("executor", "_lock")
+        excludes = ("_async_queue", "_async_thread", "_lock", "_observers_cache")
         return {k: v for k, v in self.__dict__.items() if k not in excludes}
 
     def __setstate__(self, state):
         super().__setstate__(state)
         self.max_workers = state["max_workers"]
         self.ignore_notify_errors = state["ignore_notify_errors"]
-        self.executor = ThreadPoolExecutor(self.max_workers)
+        self._async_queue = queue.SimpleQueue()
+        self._async_thread = None
+        self._refresh_observers()
+
+    def _refresh_observers(self):
+        # sorted snapshots are rebuilt on attach/detach only and swapped in as one tuple,
+        # so notify reads a consistent set without locking
+        self._observers.sort(key=lambda x: x.priority)
+        observers = tuple(self._observers)
+        self._observers_cache = (observers, observers[::-1], {})
+
+    def _get_observers_for(self, event_type: EventType, reverse: bool) -> Tuple[TestEventHandler, ...]:
+        observers, observers_rev, by_type = self._observers_cache
+        key = (event_type, reverse)
+        try:
+            return by_type[key]
+        except KeyError:
+            # callback handlers which listen for another event type are skipped up front
+            matched = tuple(
+                observer for observer in (observers_rev if reverse else observers)
+                if not isinstance(observer, CallbackTestEventHandler)
+                or observer.event_type == event_type or observer.event_type == EventType.ON_ANY_EVENT
+            )
+            by_type[key] = matched
+            return matched
 
     def shutdown(self):
-        self.executor.shutdown()
+        """
+        Wait for queued async events to be handled and the consumer thread to exit.
+        """
+        while True:
+            with self._lock:
+                thread = self._async_thread
+            if thread is None:
+                return
+            self._async_queue.put(None)
+            thread.join()
+            with self._lock:
+                if self._async_thread is thread:
+                    self._async_thread = None
+
+    def submit(self, handler: "TestEventHandler", event: Event):
+        """
+        Queue event for an async handler, the consumer thread is started on first use.
+        """
+        self._async_queue.put((handler, event))
+        if self._async_thread is None:
+            with self._lock:
+                if self._async_thread is None:
+                    self._async_thread = threading.Thread(
+                        target=self._consume_async_events, name=f"evt-{id(self):x}", daemon=True
+                    )
+                    self._async_thread.start()
+
+    def _consume_async_events(self):
+        async_queue = self._async_queue
+        current = threading.current_thread()
+        while True:
+            try:
+                batch = [async_queue.get(timeout=self.IDLE_TIMEOUT)]
+            except queue.Empty:
+                batch = [None]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(async_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            idle = False
+            for item in batch:
+                if item is None:
+                    idle = True
+                    continue
+                handler, event = item
+                try:
+                    handler.dispatch(event)
+                except Exception as err:
+                    if handler.ignore_errors:
+                        logger.exception("async event handler %s ignore errors:", handler)
+                    else:
+                        logger.exception("async event handler %s ignore_errors is False, error: %s", handler, err)
+
+            if idle and self._release_async_thread(current):
+                return
+
+    def _release_async_thread(self, current: threading.Thread) -> bool:
+        # release the slot first, then re-check so an event queued meanwhile is not left without consumer
+        with self._lock:
+            if self._async_thread is current:
+                self._async_thread = None
+        if self._async_queue.empty():
+            return True
+        with self._lock:
+            if self._async_thread is not None:
+                return True
+            self._async_thread = current
+        return False
 
     def get_observers(self, reverse=False) -> Tuple[TestEventHandler, ...]:
         """
@@ -293,14 +391,8 @@ class EventObservable(BaseObservable):
         tuple
             A tuple contains instances of :class:`TestEventHandler <TestEventHandler>`.
         """
-
-        observers = []
-        with self._lock:
-            observers.extend(self._observers)
-
-        if reverse:
-            observers.reverse()
-        return tuple(observers)
+        observers, observers_rev, _ = self._observers_cache
+        return observers_rev if reverse else observers
 
     def listen(self, event_type: EventType, callback: Callable | TestEventHandler, *args, **kwargs):
         """
@@ -318,12 +410,12 @@ class EventObservable(BaseObservable):
             used for construct an instance of TestEventHandler
         """
 
-        if inspect.isfunction(callback) or inspect.ismethod(callback):
-            listener = CallbackTestEventHandler(callback, event_type, *args, **kwargs)
-        elif isinstance(callback, TestEventHandler):
+        if isinstance(callback, TestEventHandler):
             listener = callback
-        elif inspect.isclass(callback):
+        elif isinstance(callback, type):
             listener = callback(*args, **kwargs)
+        elif isinstance(callback, _CALLBACK_TYPES):
+            listener = CallbackTestEventHandler(callback, event_type, *args, **kwargs)
         else:
             raise ValueError("Unsupported callback: %s" % callback)
         self.attach(listener)
@@ -343,20 +435,53 @@ class EventObservable(BaseObservable):
             return callback
         return wrapper_outer
 
+    @classmethod
+    def from_handlers(cls, handlers: Iterable[TestEventHandler], *args, **kwargs) -> "EventObservable":
+        """
+        Construct an instance with handlers attached, handlers are sorted by priority only once.
+
+        Parameters
+        ----------
+        handlers: iterable
+            Instances of :class:`TestEventHandler <TestEventHandler>` to attach.
+
+        *args, **kwargs:
+            pass-through to EventObservable.
+        """
+        instance = cls(*args, **kwargs)
+        for handler in handlers:
+            super(EventObservable, instance).attach(handler)
+        with instance._lock:
+            instance._refresh_observers()
+        return instance
+
     def attach(self, observer: TestEventHandler) -> NoReturn:
         """
         Add TestEventHandler into maintenance list.
         """
         super().attach(observer)
-        self._observers.sort(key=lambda x: x.priority)
+        with self._lock:
+            self._refresh_observers()
+
+    def detach(self, observer: TestEventHandler) -> NoReturn:
+        """
+        Remove TestEventHandler from maintenance list.
+        """
+        super().detach(observer)
+        with self._lock:
+            self._refresh_observers()
 
     def notify(self, event: Event, reverse: bool = False):
         """
         Notify all attached TestEventHandler when receiving event.
         """
         # logger.debug('Notify: %s', event)
+        observers = self._get_observers_for(event.type, reverse)
+        if not observers:
+            return
+
         errors = []
-        for observer in self.get_observers(reverse):
+        for observer in observers:
             try:
                 observer.update(self, event)
             except Exception as err:
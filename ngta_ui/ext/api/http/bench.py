@@ -1,15 +1,11 @@
 # coding: utf-8
 
-import json
-import json.decoder
 import typing
 import requests
-from urllib.parse import urlsplit
 
 from ngta.bench import TestBench as BaseTestBench
 from ngta.ext.database import HelperFactory, Helpers
-from ngta.serialization import pformat_json
-from .record import HttpApiTestCaseResultRecord
+from .record import HttpApiTestCaseResultRecord, pformat_body
 
 
 import logging
@@ -28,48 +24,35 @@ class RequestsSession(requests.Session):
     def send(self, request, **kwargs):
         resp = super().send(request, **kwargs)
 
-        send_body = resp.request.body if resp.request.body else ""
-
-        try:
-            recv_body = pformat_json(resp.json())
-        except ValueError:
-            recv_body = resp.text if resp.text else ""
-        logger.debug("Http Request: %s %s\n%s\n\n%s\n",
-                     resp.request.method, resp.request.url, self._pformat(resp.request.headers), send_body)
-        logger.debug("Http Response: \n%s\n\n%s", self._pformat(resp.headers), recv_body)
+        recv_body = None
+        if logger.isEnabledFor(logging.DEBUG):
+            # parsed and formatted once, reused by the record below
+            send_body = resp.request.body if resp.request.body else ""
+            recv_body = pformat_body(resp.text)
+            logger.debug("Http Request: %s %s\n%s\n\n%s\n",
+                         resp.request.method, resp.request.url, self._pformat(resp.request.headers), send_body)
+            logger.debug("Http Response: \n%s\n\n%s", self._pformat(resp.headers), recv_body)
 
         if self.record is not None:
             pair = [self.record.Request(), self.record.Response()]
             self.record.histories.append(pair)
 
-            parts = urlsplit(resp.request.url)
             pair[0].url = resp.request.url
-            pair[0].netloc = parts[1]
-            pair[0].path = parts[2]
             pair[0].method = resp.request.method
             pair[0].headers = resp.request.headers
-            pair[0].params = parts[4]
-            pair[0].body = self._pformat_body(resp.request.body)
+            pair[0].raw_body = resp.request.body
 
             pair[1].url = resp.url
             pair[1].status_code = resp.status_code
             pair[1].reason = resp.reason
             pair[1].headers = resp.headers
-            pair[1].body = self._pformat_body(resp.text)
+            pair[1].raw_body = resp.text
+            if recv_body is not None:
+                pair[1].body = recv_body
             pair[1].elapsed = resp.elapsed
 
         return resp
 
-    @classmethod
-    def _pformat_body(cls, body=None):
-        if body:
-            try:
-                data = json.loads(body)
-                return pformat_json(data)
-            except ValueError:
-                pass
-        return body
-
     def __getstate__(self):
         state = super().__getstate__()
         state['record'] = self.record
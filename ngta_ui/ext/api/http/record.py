@@ -1,39 +1,118 @@
 # coding: utf-8
 
+import json
+import datetime
+from urllib.parse import urlsplit
+
 from ngta.record import TestCaseResultRecord
+from ngta.serialization import pformat_json
 from coupling.dict import omit
-import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def pformat_body(body=None):
+    if body:
+        if orjson is not None:
+            try:
+                return orjson.dumps(orjson.loads(body), option=orjson.OPT_INDENT_2).decode()
+            except orjson.JSONDecodeError:
+                pass            # not json, or rejected by the stricter orjson parser, e.g. NaN
+        try:
+            data = json.loads(body)
+            return pformat_json(data)
+        except ValueError:
+            pass
+    return body
 
 
 class Request:
+    # url parts and pretty body are only computed when read, most records are never serialized
+    __slots__ = ("method", "url", "headers", "raw_body", "_parts", "_body")
+
     def __init__(self):
         self.method = ""
         self.url = ""
-        self.netloc = ""
-        self.path = ""
-        self.params = {}
         self.headers = {}
-        self.body = None
+        self.raw_body = None
+        self._parts = None
+
+    def _split_url(self):
+        if self._parts is None or self._parts[0] != self.url:
+            self._parts = (self.url, urlsplit(self.url))
+        return self._parts[1]
+
+    @property
+    def netloc(self):
+        return self._split_url().netloc
+
+    @property
+    def path(self):
+        return self._split_url().path
+
+    @property
+    def params(self):
+        return self._split_url().query
+
+    @property
+    def body(self):
+        try:
+            return self._body
+        except AttributeError:
+            self._body = pformat_body(self.raw_body)
+            return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
 
     def as_dict(self):
-        d = self.__dict__
-        d['headers'] = dict(self.headers)
-        return d
+        return {
+            "method": self.method,
+            "url": self.url,
+            "netloc": self.netloc,
+            "path": self.path,
+            "params": self.params,
+            "headers": dict(self.headers),
+            "body": self.body,
+        }
 
 
 class Response:
+    __slots__ = ("url", "status_code", "reason", "headers", "elapsed", "raw_body", "_body")
+
     def __init__(self):
+        self.url = ""
         self.status_code = None
         self.reason = None
         self.headers = {}
-        self.body = None
         self.elapsed = datetime.timedelta(0)
+        self.raw_body = None
+
+    @property
+    def body(self):
+        try:
+            return self._body
+        except AttributeError:
+            self._body = pformat_body(self.raw_body)
+            return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
 
     def as_dict(self):
-        d = self.__dict__
-        d['headers'] = dict(self.headers)
-        d['elapsed'] = self.elapsed.total_seconds()
-        return d
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "reason": self.reason,
+            "headers": dict(self.headers),
+            "body": self.body,
+            "elapsed": self.elapsed.total_seconds(),
+        }
 
 
 class HttpApiTestCaseResultRecord(TestCaseResultRecord):
@@ -129,7 +129,8 @@ class BaseModel(Model):
 
 
 def parse_dict(data: dict, key=CALLEE_KEY):
-    logger.debug("parse_dict: %s", pformat_json(data))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("parse_dict: %s", pformat_json(data))
     path = data[key]
     class_or_func = locate(path)
     kwargs = omit(data, key)
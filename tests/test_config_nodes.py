@@ -0,0 +1,59 @@
+# coding: utf-8
+
+import ngta_ui
+from ngta_ui.config.nodes.testsuite import TagLoaderNode, ForNode
+
+
+class TaggedCase(ngta_ui.TestCase):
+    @ngta_ui.tag("regression")
+    @ngta_ui.test
+    def test_int(self, value1=1, value2=1):
+        pass
+
+    @ngta_ui.test
+    def test_untagged(self):
+        pass
+
+
+def test_tag_loader_with_inject():
+    node = TagLoaderNode(**{
+        "tag": "regression",
+        "locates": [{
+            "path": f"{__name__}.TaggedCase",
+            "inject": {
+                "test_int": {
+                    "parameters": {"value1": 3},
+                    "iterations": {"value2": [3, 4]},
+                },
+            },
+        }],
+    })
+    models = node.as_model_list()
+    assert [model.parameters for model in models] == [{"value1": 3, "value2": 3}, {"value1": 3, "value2": 4}]
+
+
+def test_tag_loader_without_inject():
+    node = TagLoaderNode(**{"tag": "regression", "locates": [{"path": f"{__name__}.TaggedCase", "inject": None}]})
+    models = node.as_model_list()
+    assert [model.parameters for model in models] == [{"value1": 1, "value2": 1}]
+
+
+def test_for_node_keeps_list_iterations():
+    node = ForNode(**{
+        "iterations": [{"value1": 1}, {"value1": 2}],
+        "tests": [{"testcase": {"path": f"{__name__}.TaggedCase.test_int", "parameters": {"value1": "${value1}"}}}],
+    })
+    first = [model.parameters for model in node.as_model_list(variables={"value2": 5})]
+    second = [model.parameters for model in node.as_model_list()]
+    assert first == [{"value1": 1, "value2": 1}, {"value1": 2, "value2": 1}]
+    assert second == first
+    assert node.iterations == [{"value1": 1}, {"value1": 2}]
+
+
+def test_for_node_variables_override_iterations():
+    node = ForNode(**{
+        "iterations": {"value1": [1, 2]},
+        "tests": [{"testcase": {"path": f"{__name__}.TaggedCase.test_int", "parameters": {"value1": "${value1}"}}}],
+    })
+    models = node.as_model_list(variables={"value1": 9})
+    assert [model.parameters for model in models] == [{"value1": 9, "value2": 1}, {"value1": 9, "value2": 1}]
@@ -0,0 +1,46 @@
+# coding: utf-8
+
+from ngta_ui import case, suite
+from ngta_ui.config.rerun import RerunConfig
+
+# module access keeps pytest from collecting the Test* model classes.
+Status = case.TestCaseResultStatus
+
+
+def _new_rerun_config(statuses):
+    config = RerunConfig.__new__(RerunConfig)
+    config.statuses = statuses
+    config._status_set = frozenset(statuses)
+    return config
+
+
+def _tc_record(id, status):
+    return case.TestCaseResultRecord(id=id, path="sample.base.test_equal.EqualTestCase.test_int", status=status,
+                                     is_prerequisite=False)
+
+
+def test_skip_nested_testsuite_without_rerun_tests():
+    passed = suite.TestSuiteResultRecord(testsuite_id=2, name="passed", records=[
+        _tc_record(2, Status.PASSED),
+    ])
+    failed = suite.TestSuiteResultRecord(testsuite_id=3, name="failed", records=[
+        _tc_record(3, Status.FAILED),
+    ])
+    root = suite.TestSuiteResultRecord(testsuite_id=1, name="root", records=[
+        _tc_record(1, Status.FAILED), passed, failed,
+    ])
+
+    config = _new_rerun_config([Status.FAILED.value])
+    testsuite = config._gen_testsuite_from_record(root, {})
+
+    assert len(testsuite.tests) == 2
+    assert testsuite.tests[1].name == "failed"
+    assert len(testsuite.tests[1].tests) == 1
+
+
+def test_no_testsuite_without_rerun_tests():
+    root = suite.TestSuiteResultRecord(testsuite_id=1, name="root", records=[
+        suite.TestSuiteResultRecord(testsuite_id=2, name="passed", records=[_tc_record(1, Status.PASSED)]),
+    ])
+    config = _new_rerun_config([Status.FAILED.value])
+    assert config._gen_testsuite_from_record(root, {}) is None